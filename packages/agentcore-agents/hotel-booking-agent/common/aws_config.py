@@ -5,13 +5,29 @@ This module provides centralized AWS configuration management to avoid
 duplicate boto3 session creation and region detection.
 """
 
+import functools
 import logging
 import os
+import threading
 from boto3.session import Session
+from typing import Any
 
 
 logger = logging.getLogger(__name__)
 
+# Process-wide boto3 session and clients shared by every AWSConfig instance
+_SESSION: Session | None = None
+_CLIENTS: dict[str, Any] = {}
+_REGION: str | None = None
+_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_account_id(region: str) -> str | None:
+    """Look up the account ID once per process; it is fixed for a credential set."""
+    sts_client = _CLIENTS.get("sts") or AWSConfig().get_session().client("sts", region_name=region)
+    return sts_client.get_caller_identity().get("Account")
+
 
 class AWSConfig:
     """
@@ -25,15 +41,13 @@ class AWSConfig:
         Args:
             logger: Logger instance to use for logging.
         """
-        self.logger = logger
-        self._region = None
-        self._session = None
-        self._account_id = None
+        self.logger = logger or logging.getLogger(__name__)
 
     def get_region(self) -> str:
-        """Get AWS region from environment or session."""
-        if self._region:
-            return self._region
+        """Get AWS region from environment or session, resolved once per process."""
+        global _REGION
+        if _REGION:
+            return _REGION
 
         # Try environment variable first
         region = os.environ.get("AWS_DEFAULT_REGION")
@@ -44,34 +58,45 @@ class AWSConfig:
                 session = self.get_session()
                 region = session.region_name
             except Exception as e:
-                self.logger.warning(f"Failed to get region from boto3 session: {e}", "ERROR")
+                self.logger.warning("Failed to get region from boto3 session: %s", e)
 
         if not region:
             raise ValueError("Unable to determine AWS region from environment or session")
 
-        self._region = region
-        self.logger.info(f"AWS region: {region}")
+        _REGION = region
+        self.logger.info("AWS region: %s", region)
         return region
 
     def get_session(self) -> Session:
-        """Get or create a boto3 session."""
-        if not self._session:
-            self._session = Session()
-        return self._session
-
-    def get_account_id(self) -> str | None:
-        """Get the AWS account ID."""
-        if self._account_id:
-            return self._account_id
+        """Get or create the process-wide boto3 session."""
+        global _SESSION
+        if _SESSION is None:
+            with _LOCK:
+                if _SESSION is None:
+                    _SESSION = Session()
+        return _SESSION
+
+    def get_client(self, service_name: str) -> Any:
+        """
+        Get a boto3 client for the given service, shared across the process.
 
-        try:
+        Args:
+            service_name: AWS service name, e.g. "logs" or "secretsmanager"
+        """
+        client = _CLIENTS.get(service_name)
+        if client is None:
             session = self.get_session()
             region = self.get_region()
-            sts_client = session.client("sts", region_name=region)
-            identity = sts_client.get_caller_identity()
-            self._account_id = identity.get("Account")
-            self.logger.info(f"AWS account ID: {self._account_id}")
-            return self._account_id
+            with _LOCK:
+                client = _CLIENTS.setdefault(service_name, session.client(service_name, region_name=region))
+        return client
+
+    def get_account_id(self) -> str | None:
+        """Get the AWS account ID, cached for the life of the process."""
+        try:
+            account_id = _resolve_account_id(self.get_region())
+            self.logger.info("AWS account ID: %s", account_id)
+            return account_id
         except Exception as e:
-            self.logger.warning(f"Failed to get AWS account ID: {e}", "ERROR")
+            self.logger.warning("Failed to get AWS account ID: %s", e)
             return None
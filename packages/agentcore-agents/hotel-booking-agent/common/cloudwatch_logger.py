@@ -1,7 +1,24 @@
-import boto3
+import atexit
+import queue
+import secrets
+import threading
 import time
-import uuid
+from botocore.exceptions import ClientError
+from common.aws_config import AWSConfig
 from datetime import datetime
+from typing import Any
+
+
+# CloudWatch Logs PutLogEvents limits
+MAX_BATCH_EVENTS = 10_000
+MAX_BATCH_BYTES = 1_048_576
+MAX_EVENT_BYTES = 262_144
+EVENT_OVERHEAD_BYTES = 26
+
+# Each stream accepts 5 PutLogEvents calls per second; throttling opens another, up to this many
+MAX_LOG_STREAMS = 8
+
+LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "WARN": 30, "WARNING": 30, "ERROR": 40}
 
 
 class CloudWatchLogger:
@@ -10,7 +27,18 @@ class CloudWatchLogger:
     and gracefully handles permission issues by falling back to console logging.
     """
 
-    def __init__(self, log_group_name: str, log_stream_name: str | None = None):
+    def __init__(
+        self,
+        log_group_name: str,
+        log_stream_name: str | None = None,
+        flush_interval: float = 5.0,
+        max_batch_events: int = 1000,
+        max_buffer_size: int = 10_000,
+        logs_client: Any = None,
+        create_group: bool = True,
+        create_stream: bool = True,
+        min_level: str = "DEBUG",
+    ):
         """
         Initialize CloudWatch logger.
 
@@ -18,25 +46,55 @@ class CloudWatchLogger:
             log_group_name: Name of the CloudWatch log group
             log_stream_name: Optional name for the log stream. If not provided,
                            generates a unique name with timestamp and UUID
+            flush_interval: Maximum seconds a message waits before being sent
+            max_batch_events: Number of queued messages that triggers an early flush
+            max_buffer_size: Maximum number of messages held in memory. Messages logged
+                           while the buffer is full are dropped instead of blocking
+            logs_client: Optional CloudWatch Logs client. Defaults to the shared
+                       client from AWSConfig
+            create_group: Check for and create the log group at startup. Pass False
+                        when the group is already provisioned
+            create_stream: Check for and create the log stream at startup. Pass False
+                         when the stream is already provisioned
+            min_level: Messages below this level (DEBUG, INFO, WARN, ERROR) are discarded.
+                       Case-insensitive; unknown levels fall back to INFO
         """
-        self.logs_client = boto3.client("logs")
+        self.logs_client = logs_client or AWSConfig().get_client("logs")
         self.log_group_name = log_group_name
         self.log_stream_name = (
-            log_stream_name
-            or f"hotel-booking-agent-{datetime.now().strftime('%Y-%m-%d-%H-%M-%S')}-{str(uuid.uuid4())[:8]}"
+            log_stream_name or f"hotel-booking-agent-{datetime.now():%Y-%m-%d-%H-%M-%S}-{secrets.token_hex(4)}"
         )
-        self.sequence_token = None
+        self._streams = [self.log_stream_name]
+        self._stream_index = 0
         self.cloudwatch_enabled = False
+        self.create_group = create_group
+        self.create_stream = create_stream
+        self.flush_interval = flush_interval
+        self.max_batch_events = min(max_batch_events, MAX_BATCH_EVENTS)
+        self.min_level = LOG_LEVELS.get(min_level.upper(), LOG_LEVELS["INFO"])
+        self._dropped_count = 0
+        # Separate from _lock, which is held across PutLogEvents calls, so log() never waits on the network
+        self._dropped_lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=max_buffer_size)
+        self._lock = threading.Lock()
+        self._flush_event = threading.Event()
         self._setup_log_stream()
 
+        if self.cloudwatch_enabled:
+            self._flush_thread = threading.Thread(target=self._flush_loop, name="cloudwatch-logger", daemon=True)
+            self._flush_thread.start()
+            atexit.register(self.flush)
+
     def _setup_log_stream(self):
         """Create log group and log stream if they don't exist, with graceful permission handling"""
-        try:
-            # First, try to check if log group exists (this requires fewer permissions)
-            log_group_exists = self._check_log_group_exists()
+        if not self.create_group and not self.create_stream:
+            # Group and stream are provisioned; a missing resource is recovered on first put
+            self.cloudwatch_enabled = True
+            return
 
-            if not log_group_exists:
-                # Try to create log group if it doesn't exist
+        try:
+            if self.create_group:
+                # Create the log group optimistically; an existing group is reused as-is
                 try:
                     self.logs_client.create_log_group(logGroupName=self.log_group_name)
                     print(f"Created log group: {self.log_group_name}")
@@ -52,21 +110,16 @@ class CloudWatchLogger:
                         self.cloudwatch_enabled = False
                         return
 
-            # Check if log stream already exists before creating
-            existing_stream = self._check_log_stream_exists()
-            if existing_stream:
-                print(f"Using existing log stream: {self.log_stream_name}")
-                self.sequence_token = existing_stream.get("uploadSequenceToken")
+            if not self.create_stream:
+                self.cloudwatch_enabled = True
                 return
 
-            # Try to create log stream
+            # Create the log stream optimistically; an existing stream is reused as-is
             try:
                 self.logs_client.create_log_stream(logGroupName=self.log_group_name, logStreamName=self.log_stream_name)
                 print(f"Created log stream: {self.log_stream_name}")
             except self.logs_client.exceptions.ResourceAlreadyExistsException:
-                print(f"Log stream already exists: {self.log_stream_name}")
-                # Get the sequence token for existing stream
-                self._get_sequence_token()
+                print(f"Using existing log stream: {self.log_stream_name}")
             except Exception as e:
                 if "AccessDenied" in str(e) or "not authorized" in str(e):
                     print(f"No permission to create log stream. Falling back to console logging. Error: {e}")
@@ -77,79 +130,195 @@ class CloudWatchLogger:
                     self.cloudwatch_enabled = False
                     return
 
-        except Exception as e:
-            print(f"Error setting up CloudWatch logging: {e}")
-            self.cloudwatch_enabled = False
-
-    def _check_log_group_exists(self):
-        """Check if log group exists without creating it"""
-        try:
-            response = self.logs_client.describe_log_groups(logGroupNamePrefix=self.log_group_name, limit=1)
-            return any(lg["logGroupName"] == self.log_group_name for lg in response.get("logGroups", []))
-        except Exception as e:
-            print(f"Error checking log group existence: {e}")
-            return False
-
-    def _check_log_stream_exists(self):
-        """Check if log stream exists and return its details"""
-        try:
-            response = self.logs_client.describe_log_streams(
-                logGroupName=self.log_group_name, logStreamNamePrefix=self.log_stream_name, limit=1
-            )
-            for stream in response.get("logStreams", []):
-                if stream["logStreamName"] == self.log_stream_name:
-                    return stream
-            return None
-        except Exception as e:
-            print(f"Error checking log stream existence: {e}")
-            return None
+            self.cloudwatch_enabled = True
 
-    def _get_sequence_token(self):
-        """Get the sequence token for the log stream"""
-        try:
-            response = self.logs_client.describe_log_streams(
-                logGroupName=self.log_group_name, logStreamNamePrefix=self.log_stream_name
-            )
-            if response["logStreams"]:
-                self.sequence_token = response["logStreams"][0].get("uploadSequenceToken")
         except Exception as e:
-            print(f"Error getting sequence token: {e}")
+            print(f"Error setting up CloudWatch logging: {e}")
             self.cloudwatch_enabled = False
 
     def log(self, message: str, level: str = "INFO"):
         """
-        Send log message to CloudWatch or fallback to console.
+        Queue a log message for CloudWatch or fallback to console.
+
+        Messages are sent in batches by a background thread, so this call
+        never waits on the CloudWatch API. If the buffer is full the message
+        is dropped and counted in ``dropped_count``.
 
         Args:
             message: The log message to send
             level: Log level (INFO, ERROR, WARN, DEBUG)
         """
+        if LOG_LEVELS.get(level.upper(), LOG_LEVELS["INFO"]) < self.min_level:
+            return
+
         # If CloudWatch is disabled, use console logging
         if not self.cloudwatch_enabled:
             print(f"[{level}] {message}")
             return
 
+        # Message formatting is left to the flush thread
+        timestamp = time.time_ns() // 1_000_000
+        try:
+            self._queue.put_nowait((timestamp, level, message))
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped_count += 1
+            return
+
+        if self._queue.qsize() >= self.max_batch_events:
+            self._flush_event.set()
+
+    @property
+    def dropped_count(self) -> int:
+        """Number of messages dropped because the buffer was full"""
+        with self._dropped_lock:
+            return self._dropped_count
+
+    def flush(self):
+        """Send all queued log messages to CloudWatch."""
+        # Serialize flushes so the worker thread and atexit never put concurrently
+        with self._lock:
+            entries = []
+            while True:
+                try:
+                    entries.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if not entries:
+                return
+
+            # PutLogEvents requires events in chronological order
+            entries.sort(key=lambda entry: entry[0])
+            truncate = self._truncate_message
+            events = [
+                {"timestamp": timestamp, "message": truncate(f"[{level}] {message}")}
+                for timestamp, level, message in entries
+            ]
+
+            if not self.cloudwatch_enabled:
+                for event in events:
+                    print(event["message"])
+                return
+
+            for batch in self._chunk_events(events):
+                self._put_batch(batch)
+
+    def _flush_loop(self):
+        """Background worker that flushes the queue on an interval or when it fills up"""
+        while self.cloudwatch_enabled:
+            self._flush_event.wait(timeout=self.flush_interval)
+            self._flush_event.clear()
+            self.flush()
+
+    @staticmethod
+    def _truncate_message(message: str) -> str:
+        """Cut a message down to the CloudWatch per-event size limit"""
+        message_bytes = message.encode("utf-8")
+        if len(message_bytes) + EVENT_OVERHEAD_BYTES <= MAX_EVENT_BYTES:
+            return message
+
+        suffix = f"...[truncated {len(message_bytes)} bytes]"
+        keep = MAX_EVENT_BYTES - EVENT_OVERHEAD_BYTES - len(suffix.encode("utf-8"))
+        return message_bytes[:keep].decode("utf-8", errors="ignore") + suffix
+
+    def _chunk_events(self, events: list[dict]):
+        """Split events into batches that respect the PutLogEvents count and size limits"""
+        batch = []
+        batch_bytes = 0
+        for event in events:
+            event_bytes = len(event["message"].encode("utf-8")) + EVENT_OVERHEAD_BYTES
+            if batch and (len(batch) >= MAX_BATCH_EVENTS or batch_bytes + event_bytes > MAX_BATCH_BYTES):
+                yield batch
+                batch = []
+                batch_bytes = 0
+            batch.append(event)
+            batch_bytes += event_bytes
+        if batch:
+            yield batch
+
+    def _next_log_stream(self) -> str:
+        """Pick the next log stream, round-robin across all open streams"""
+        stream_name = self._streams[self._stream_index % len(self._streams)]
+        self._stream_index += 1
+        return stream_name
+
+    def _add_log_stream(self) -> bool:
+        """Open an additional log stream to spread puts across more per-stream quota"""
+        if len(self._streams) >= MAX_LOG_STREAMS:
+            return False
+
+        stream_name = f"{self.log_stream_name}-{len(self._streams)}"
+        try:
+            self.logs_client.create_log_stream(logGroupName=self.log_group_name, logStreamName=stream_name)
+            print(f"Created log stream: {stream_name}")
+        except self.logs_client.exceptions.ResourceAlreadyExistsException:
+            pass
+        except Exception as e:
+            print(f"Error creating additional log stream: {e}")
+            return False
+
+        self._streams.append(stream_name)
+        return True
+
+    def _put_batch(self, batch: list[dict], retry: bool = True):
+        """Send a single batch of log events to CloudWatch"""
+        stream_name = self._next_log_stream()
         try:
-            timestamp = int(time.time() * 1000)
-            log_event = {"timestamp": timestamp, "message": f"[{level}] {message}"}
+            self.logs_client.put_log_events(
+                logGroupName=self.log_group_name, logStreamName=stream_name, logEvents=batch
+            )
+
+        except self.logs_client.exceptions.ResourceNotFoundException as e:
+            # Group or stream was assumed to exist but doesn't; create it and retry once
+            if retry and self._create_missing_log_stream(stream_name):
+                self._put_batch(batch, retry=False)
+            else:
+                self._fallback_to_console(batch, e)
 
-            put_log_events_kwargs = {
-                "logGroupName": self.log_group_name,
-                "logStreamName": self.log_stream_name,
-                "logEvents": [log_event],
-            }
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ThrottlingException":
+                disable = "AccessDenied" in str(e) or "not authorized" in str(e)
+                self._fallback_to_console(batch, e, disable=disable)
+            elif retry:
+                # Shard onto another stream when available and retry on the next one in rotation
+                self._add_log_stream()
+                self._put_batch(batch, retry=False)
+            else:
+                self._fallback_to_console(batch, e, disable=False)
+
+        except Exception as e:
+            # Only permission problems are permanent; anything else affects this batch alone
+            disable = "AccessDenied" in str(e) or "not authorized" in str(e)
+            self._fallback_to_console(batch, e, disable=disable)
 
-            if self.sequence_token:
-                put_log_events_kwargs["sequenceToken"] = self.sequence_token
+    def _create_missing_log_stream(self, stream_name: str) -> bool:
+        """Create the log group and stream after a put reported them missing"""
+        try:
+            try:
+                self.logs_client.create_log_group(logGroupName=self.log_group_name)
+                print(f"Created log group: {self.log_group_name}")
+            except self.logs_client.exceptions.ResourceAlreadyExistsException:
+                pass
 
-            response = self.logs_client.put_log_events(**put_log_events_kwargs)
-            self.sequence_token = response.get("nextSequenceToken")
+            try:
+                self.logs_client.create_log_stream(logGroupName=self.log_group_name, logStreamName=stream_name)
+                print(f"Created log stream: {stream_name}")
+            except self.logs_client.exceptions.ResourceAlreadyExistsException:
+                pass
 
+            return True
         except Exception as e:
-            print(f"Error sending log to CloudWatch: {e}")
-            # Disable CloudWatch logging for future calls and fallback to console
+            print(f"Error creating missing log stream: {e}")
+            return False
+
+    def _fallback_to_console(self, batch: list[dict], error: Exception, disable: bool = True):
+        """Print the batch to console, optionally disabling CloudWatch logging for future calls"""
+        print(f"Error sending log to CloudWatch: {error}")
+        if disable:
             self.cloudwatch_enabled = False
-            print(f"[{level}] {message}")
+        for event in batch:
+            print(event["message"])
 
     def is_enabled(self):
         """Check if CloudWatch logging is enabled"""
@@ -160,5 +329,7 @@ class CloudWatchLogger:
         return {
             "log_group_name": self.log_group_name,
             "log_stream_name": self.log_stream_name,
+            "log_stream_names": list(self._streams),
             "cloudwatch_enabled": self.cloudwatch_enabled,
+            "dropped_count": self.dropped_count,
         }
@@ -2,58 +2,100 @@
 Cognito Token Manager for refreshing bearer tokens using Cognito credentials.
 """
 
-import boto3
+import asyncio
+import base64
 import json
 import logging
+import time
 from botocore.exceptions import ClientError
+from common.aws_config import AWSConfig
+from typing import Any
 
 
 logger = logging.getLogger(__name__)
 
+# Refresh tokens this many seconds before they actually expire
+TOKEN_EXPIRY_SKEW_SECONDS = 60
+
+# Only these non-secret fields are kept from the Secrets Manager secret
+COGNITO_CONFIG_KEYS = ("client_id", "pool_id", "discovery_url")
+
+# Cognito client settings per secret name, shared by every token manager in the process.
+# The username and password are never cached; they are re-read from the secret when needed.
+_CONFIG_CACHE: dict[str, dict[str, str]] = {}
+
 
 class CognitoTokenManager:
     """Manages Cognito authentication tokens for AgentCore communication."""
 
-    def __init__(self, secret_name: str = "hotel_booking_agent/cognito/credentials"):
+    def __init__(
+        self,
+        secret_name: str = "hotel_booking_agent/cognito/credentials",
+        secrets_client: Any = None,
+        cognito_client: Any = None,
+    ):
         """
         Initialize the token manager.
 
         Args:
             secret_name: AWS Secrets Manager secret name containing Cognito credentials
+            secrets_client: Optional Secrets Manager client. Defaults to the shared
+                          client from AWSConfig
+            cognito_client: Optional Cognito Identity Provider client. Defaults to the
+                          shared client from AWSConfig
         """
+        aws_config = AWSConfig()
         self.secret_name = secret_name
-        self.secrets_client = boto3.client("secretsmanager")
-        self._cached_credentials = None
+        self.secrets_client = secrets_client or aws_config.get_client("secretsmanager")
+        self.cognito_client = cognito_client or aws_config.get_client("cognito-idp")
+        self._cached_token = None
+        self._refresh_token = None
+        self._token_expiry = 0.0
 
     def _get_cognito_credentials(self) -> dict[str, str]:
         """
         Retrieve Cognito credentials from AWS Secrets Manager.
+        Only the fields in COGNITO_CONFIG_KEYS are cached for the process, so
+        callers must not keep the returned username and password.
 
         Returns:
-            Dictionary containing pool_id, client_id, discovery_url, etc.
+            Dictionary containing pool_id, client_id, discovery_url, username, password
         """
         try:
-            if self._cached_credentials is None:
-                logger.info("Retrieving Cognito credentials from Secrets Manager")
-
-                secret_value = self.secrets_client.get_secret_value(SecretId=self.secret_name)
-                self._cached_credentials = json.loads(secret_value["SecretString"])
+            logger.info("Retrieving Cognito credentials from Secrets Manager")
 
-                logger.info("Successfully retrieved Cognito credentials")
+            secret_value = self.secrets_client.get_secret_value(SecretId=self.secret_name)
+            secret = json.loads(secret_value["SecretString"])
+            _CONFIG_CACHE[self.secret_name] = {key: secret[key] for key in COGNITO_CONFIG_KEYS if key in secret}
 
-            return self._cached_credentials
+            logger.info("Successfully retrieved Cognito credentials")
+            return secret
 
         except ClientError as e:
-            logger.error(f"Failed to retrieve Cognito credentials: {e.response['Error']['Code']}")
+            logger.error("Failed to retrieve Cognito credentials: %s", e.response["Error"]["Code"])
             raise
         except json.JSONDecodeError:
             logger.error("Failed to parse Cognito credentials JSON")
             raise
 
+    def _get_cognito_config(self) -> dict[str, str]:
+        """
+        Get the Cognito client settings, reading the secret only on first use.
+
+        Returns:
+            Dictionary containing pool_id, client_id, discovery_url
+        """
+        config = _CONFIG_CACHE.get(self.secret_name)
+        if config is None:
+            self._get_cognito_credentials()
+            config = _CONFIG_CACHE[self.secret_name]
+        return config
+
     def refresh_bearer_token(self) -> str:
         """
         Refresh the bearer token using Cognito authentication.
-        Retrieves username and password from Secrets Manager.
+        Uses the refresh token from a previous login when available, otherwise
+        re-reads the username and password from Secrets Manager and authenticates.
 
         Returns:
             Fresh bearer token string
@@ -62,27 +104,41 @@ class CognitoTokenManager:
             Exception: If token refresh fails
         """
         try:
-            credentials = self._get_cognito_credentials()
-            client_id = credentials["client_id"]
-
-            # Get username and password from the credentials stored in Secrets Manager
-            username = credentials.get("username", "")
-            password = credentials.get("password", "")
-
             logger.info("Refreshing bearer token")
 
-            # Initialize Cognito Identity Provider client
-            cognito_client = boto3.client("cognito-idp")
-
-            # Authenticate user and get fresh access token
-            auth_response = cognito_client.initiate_auth(
-                ClientId=client_id,
-                AuthFlow="USER_PASSWORD_AUTH",
-                AuthParameters={"USERNAME": username, "PASSWORD": password},
-            )
-
-            # Extract the access token
-            bearer_token = auth_response["AuthenticationResult"]["AccessToken"]
+            auth_result = None
+            if self._refresh_token:
+                try:
+                    auth_response = self.cognito_client.initiate_auth(
+                        ClientId=self._get_cognito_config()["client_id"],
+                        AuthFlow="REFRESH_TOKEN_AUTH",
+                        AuthParameters={"REFRESH_TOKEN": self._refresh_token},
+                    )
+                    auth_result = auth_response["AuthenticationResult"]
+                except ClientError as e:
+                    logger.info("Refresh token rejected, re-authenticating: %s", e.response["Error"]["Code"])
+                    self._refresh_token = None
+
+            if auth_result is None:
+                # One Secrets Manager read supplies the client ID and the username and password,
+                # which are not kept after this call
+                credentials = self._get_cognito_credentials()
+                username = credentials.get("username", "")
+                password = credentials.get("password", "")
+
+                # Authenticate user and get fresh access token
+                auth_response = self.cognito_client.initiate_auth(
+                    ClientId=credentials["client_id"],
+                    AuthFlow="USER_PASSWORD_AUTH",
+                    AuthParameters={"USERNAME": username, "PASSWORD": password},
+                )
+                auth_result = auth_response["AuthenticationResult"]
+                self._refresh_token = auth_result.get("RefreshToken")
+
+            # Extract the access token and remember when it expires
+            bearer_token = auth_result["AccessToken"]
+            self._cached_token = bearer_token
+            self._token_expiry = self._get_token_expiry(bearer_token, auth_result.get("ExpiresIn", 3600))
 
             logger.info("Successfully refreshed bearer token")
             return bearer_token
@@ -91,7 +147,7 @@ class CognitoTokenManager:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
             error_message = e.response.get("Error", {}).get("Message", str(e))
 
-            logger.error(f"Cognito authentication failed - {error_code}: {error_message}")
+            logger.error("Cognito authentication failed - %s: %s", error_code, error_message)
 
             if error_code == "NotAuthorizedException":
                 raise Exception("Authentication failed: Invalid username or password") from e
@@ -103,19 +159,57 @@ class CognitoTokenManager:
                 raise Exception(f"Cognito authentication error: {error_message}") from e
 
         except Exception as e:
-            logger.error(f"Unexpected error during token refresh: {e}")
+            logger.error("Unexpected error during token refresh: %s", e)
             raise Exception(f"Token refresh failed: {str(e)}") from e
 
+    @property
+    def token_expiry(self) -> float:
+        """Epoch seconds at which the cached token should no longer be used, 0.0 before the first login."""
+        return self._token_expiry
+
+    @staticmethod
+    def _get_token_expiry(token: str, expires_in: int) -> float:
+        """
+        Work out when a token should be refreshed.
+        Prefers the JWT exp claim (read without verifying the signature) and
+        falls back to the ExpiresIn value from the auth response.
+
+        Returns:
+            Epoch seconds at which the cached token should no longer be used
+        """
+        try:
+            payload = token.split(".")[1]
+            claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+            expires_at = float(claims["exp"])
+        except (IndexError, KeyError, TypeError, ValueError):
+            expires_at = time.time() + expires_in
+        return expires_at - TOKEN_EXPIRY_SKEW_SECONDS
+
     def get_fresh_token(self) -> str:
         """
         Get a fresh bearer token, refreshing if necessary.
-        Retrieves username and password from Secrets Manager.
+        Returns the cached token until it is close to expiry.
 
         Returns:
             Fresh bearer token string
         """
+        if self._cached_token and time.time() < self._token_expiry:
+            return self._cached_token
         return self.refresh_bearer_token()
 
+    async def get_fresh_token_async(self) -> str:
+        """
+        Async variant of get_fresh_token for use inside an event loop.
+        A cached token is returned directly; a refresh runs in a worker thread
+        so the Cognito round trip does not block the loop.
+
+        Returns:
+            Fresh bearer token string
+        """
+        if self._cached_token and time.time() < self._token_expiry:
+            return self._cached_token
+        return await asyncio.to_thread(self.refresh_bearer_token)
+
     def get_cognito_info(self) -> dict[str, str]:
         """
         Get Cognito configuration information.
@@ -123,9 +217,9 @@ class CognitoTokenManager:
         Returns:
             Dictionary with pool_id, client_id, discovery_url
         """
-        credentials = self._get_cognito_credentials()
+        config = self._get_cognito_config()
         return {
-            "pool_id": credentials.get("pool_id"),
-            "client_id": credentials.get("client_id"),
-            "discovery_url": credentials.get("discovery_url"),
+            "pool_id": config.get("pool_id"),
+            "client_id": config.get("client_id"),
+            "discovery_url": config.get("discovery_url"),
         }
@@ -4,6 +4,7 @@ System prompts for the hotel booking agent.
 This module contains all the system prompts and prompt templates used by the hotel booking agent.
 """
 
+import functools
 from datetime import datetime
 
 
@@ -12,17 +13,7 @@ def get_formatted_date() -> str:
     return datetime.now().strftime("%Y-%m-%d")
 
 
-def get_hotel_booking_system_prompt(tools_descriptions: list[str]) -> str:
-    """
-    Get the comprehensive system prompt for the hotel booking agent.
-
-    Args:
-        tools_descriptions: List of tool descriptions to include in the prompt
-
-    Returns:
-        Formatted system prompt string
-    """
-    return """
+HOTEL_BOOKING_SYSTEM_PROMPT_TEMPLATE = """
 You are a professional hotel booking assistant with comprehensive booking management capabilities and access to customer history and preferences.
 
 Today's Date is : {today_date}
@@ -183,7 +174,26 @@ Refer to "Recent conversation" history to find out more about past conversation
 Available tools:
 {tools}
 
-""".format(today_date=get_formatted_date(), tools="\n".join(tools_descriptions))
+"""
+
+
+def get_hotel_booking_system_prompt(tools_descriptions: list[str]) -> str:
+    """
+    Get the comprehensive system prompt for the hotel booking agent.
+
+    Args:
+        tools_descriptions: List of tool descriptions to include in the prompt
+
+    Returns:
+        Formatted system prompt string
+    """
+    return _format_hotel_booking_system_prompt(tuple(tools_descriptions), get_formatted_date())
+
+
+@functools.lru_cache(maxsize=8)
+def _format_hotel_booking_system_prompt(tools_descriptions: tuple[str, ...], today_date: str) -> str:
+    """Format the system prompt, cached per tool set and date."""
+    return HOTEL_BOOKING_SYSTEM_PROMPT_TEMPLATE.format(today_date=today_date, tools="\n".join(tools_descriptions))
 
 
 # Additional prompt templates for specific scenarios
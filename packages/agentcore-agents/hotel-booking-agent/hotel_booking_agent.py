@@ -1,7 +1,10 @@
 import boto3
+import functools
 import json
 import logging
-import traceback
+import os
+import time
+import urllib.parse
 import uuid
 from bedrock_agentcore import BedrockAgentCoreApp
 
@@ -10,13 +13,11 @@ from common.aws_config import AWSConfig
 from common.cognito_token_manager import CognitoTokenManager
 from common.prompts import get_hotel_booking_system_prompt
 from datetime import datetime
-from mcp.client.streamable_http import streamablehttp_client
 from memory.short_term_memory import ShortTermMemoryHooks, create_hotel_booking_short_term_memory
 from starlette.applications import Starlette
 from starlette.middleware.cors import CORSMiddleware
 from strands import Agent
 from strands.models import BedrockModel
-from strands.tools.mcp.mcp_client import MCPClient
 
 
 # Configure default logging
@@ -38,6 +39,99 @@ AWS_REGION = aws_config.get_region()
 
 # Configure boto3 clients
 bedrock_client = boto3.client("bedrock-runtime")
+ssm_client = aws_config.get_client("ssm")
+
+bedrock_model = BedrockModel(model_id="us.anthropic.claude-sonnet-4-20250514-v1:0", client=bedrock_client)
+
+# Token managers keyed by secret name, kept across invocations so cached tokens are reused
+_token_managers: dict[str, CognitoTokenManager] = {}
+
+# MCP server runtime parameters, written by the MCP server stack under /{tool_name}/runtime/
+MCP_TOOL_NAME = "hotel_booking_mcp"
+MCP_AGENT_NAME_PARAMETER = f"/{MCP_TOOL_NAME}/runtime/agent_name"
+MCP_AGENT_ARN_PARAMETER = f"/{MCP_TOOL_NAME}/runtime/agent_arn"
+
+# Short-term memory ID persisted after first resolution so cold starts can skip listing memories.
+# The stack creates the parameter (holding a placeholder) and passes its name to the runtime.
+SHORT_TERM_MEMORY_ID_PARAMETER = os.environ.get(
+    "SHORT_TERM_MEMORY_ID_PARAMETER", "/hotel_booking_agent/runtime/short_term_memory_id"
+)
+SHORT_TERM_MEMORY_ID_PLACEHOLDER = "unset"
+
+# SSM parameter values cached across warm invocations: name -> (fetched_at, value)
+SSM_CACHE_TTL_SECONDS = 900
+_SSM_CACHE: dict[str, tuple[float, str]] = {}
+
+
+def get_ssm_parameters(*names: str, ttl: float = SSM_CACHE_TTL_SECONDS) -> dict[str, str]:
+    """
+    Get SSM parameter values, reusing cached values until they are older than ttl seconds.
+    Any names not in the cache are fetched together in a single GetParameters call.
+    """
+    now = time.monotonic()
+    values = {}
+    missing = []
+    for name in names:
+        cached = _SSM_CACHE.get(name)
+        if cached and now - cached[0] < ttl:
+            values[name] = cached[1]
+        else:
+            missing.append(name)
+
+    if missing:
+        response = ssm_client.get_parameters(Names=missing)
+        for parameter in response["Parameters"]:
+            _SSM_CACHE[parameter["Name"]] = (now, parameter["Value"])
+            values[parameter["Name"]] = parameter["Value"]
+
+    return values
+
+
+def get_token_manager(secret_name: str) -> CognitoTokenManager:
+    """Get the shared token manager for a Cognito credentials secret"""
+    token_manager = _token_managers.get(secret_name)
+    if token_manager is None:
+        token_manager = _token_managers[secret_name] = CognitoTokenManager(secret_name=secret_name)
+    return token_manager
+
+
+@functools.lru_cache(maxsize=8)
+def get_mcp_url(agent_arn: str) -> str:
+    """Build the AgentCore runtime invocation URL for an MCP server ARN"""
+    encoded_arn = urllib.parse.quote(agent_arn, safe="")
+    return f"https://bedrock-agentcore.{AWS_REGION}.amazonaws.com/runtimes/{encoded_arn}/invocations?qualifier=DEFAULT"
+
+
+def get_ssm_parameter(name: str, ttl: float = SSM_CACHE_TTL_SECONDS) -> str:
+    """Get a single SSM parameter value through the shared cache"""
+    values = get_ssm_parameters(name, ttl=ttl)
+    if name not in values:
+        raise ValueError(f"SSM parameter not found: {name}")
+    return values[name]
+
+
+def load_short_term_memory():
+    """Resolve short-term memory, reusing the memory ID persisted in SSM while it is still valid"""
+    try:
+        known_memory_id = get_ssm_parameter(SHORT_TERM_MEMORY_ID_PARAMETER)
+    except Exception:
+        known_memory_id = None
+    if known_memory_id == SHORT_TERM_MEMORY_ID_PLACEHOLDER:
+        known_memory_id = None
+
+    memory_id, memory_client = create_hotel_booking_short_term_memory(logger, AWS_REGION, memory_id=known_memory_id)
+
+    if memory_id != known_memory_id:
+        try:
+            ssm_client.put_parameter(
+                Name=SHORT_TERM_MEMORY_ID_PARAMETER, Value=memory_id, Type="String", Overwrite=True
+            )
+            _SSM_CACHE[SHORT_TERM_MEMORY_ID_PARAMETER] = (time.monotonic(), memory_id)
+        except Exception as e:
+            logger.warning("Failed to persist short-term memory ID: %s", e)
+
+    return memory_id, memory_client
+
 
 app = BedrockAgentCoreApp()
 app = Starlette(app)
@@ -54,12 +148,12 @@ def initialize_memory():
     try:
         if AWS_REGION:
             # Initialize short-term memory
-            short_term_memory_id, short_term_memory_client = create_hotel_booking_short_term_memory(logger, AWS_REGION)
-            logger.info(f"✅ Short-term memory initialized at load time: {short_term_memory_id}")
+            short_term_memory_id, short_term_memory_client = load_short_term_memory()
+            logger.info("✅ Short-term memory initialized at load time: %s", short_term_memory_id)
         else:
-            logger.warn("⚠️ No AWS region available at load time, will initialize on first invocation")
+            logger.warning("⚠️ No AWS region available at load time, will initialize on first invocation")
     except Exception as e:
-        logger.warn(f"⚠️ Failed to initialize memory at load time: {e}")
+        logger.warning("⚠️ Failed to initialize memory at load time: %s", e)
         # Memory will be created on first invocation if this fails
 
 
@@ -69,7 +163,7 @@ initialize_memory()
 
 @app.entrypoint
 async def agent_invocation(payload, context):  # noqa: ARG001
-    logger.info(f"Received payload: {payload}")
+    logger.info("Received payload: %s", payload)
 
     """Handler for agent invocation"""
     prompt = payload.get(
@@ -81,43 +175,43 @@ async def agent_invocation(payload, context):  # noqa: ARG001
     session_id = payload.get("session_id", f"booking_{datetime.now().strftime('%Y%m%d%H%M%S')}")
 
     try:
-        # Get tool name from SSM to construct proper parameter paths
-        ssm_client = boto3.client("ssm", region_name=AWS_REGION)
-        tool_name_response = ssm_client.get_parameter(Name="/hotel_booking_mcp/runtime/agent_name")
-        tool_name = tool_name_response["Parameter"]["Value"]
-        logger.info(f"Retrieved tool name: {tool_name}")
-
-        agent_arn_response = ssm_client.get_parameter(Name=f"/{tool_name}/runtime/agent_arn")
-        agent_arn = agent_arn_response["Parameter"]["Value"]
-        logger.info(f"Retrieved Agent ARN: {agent_arn}")
+        # Get tool name and agent ARN from SSM in one call; the MCP stack stores both under the tool name
+        parameters = get_ssm_parameters(MCP_AGENT_NAME_PARAMETER, MCP_AGENT_ARN_PARAMETER)
+        tool_name = parameters.get(MCP_AGENT_NAME_PARAMETER)
+        if not tool_name:
+            raise ValueError(f"SSM parameter not found: {MCP_AGENT_NAME_PARAMETER}")
+        logger.info("Retrieved tool name: %s", tool_name)
+
+        if tool_name == MCP_TOOL_NAME and MCP_AGENT_ARN_PARAMETER in parameters:
+            agent_arn = parameters[MCP_AGENT_ARN_PARAMETER]
+        else:
+            agent_arn = get_ssm_parameter(f"/{tool_name}/runtime/agent_arn")
+        logger.info("Retrieved Agent ARN: %s", agent_arn)
 
         # Initialize token manager and get fresh bearer token
-        token_manager = CognitoTokenManager(secret_name=f"{tool_name}/cognito/credentials")
-        bearer_token = token_manager.get_fresh_token()
+        token_manager = get_token_manager(f"{tool_name}/cognito/credentials")
+        bearer_token = await token_manager.get_fresh_token_async()
         logger.info("✓ Retrieved bearer token from Secrets Manager")
 
         # Use global memory or create if not available
         global short_term_memory_id, short_term_memory_client
         if not short_term_memory_id or not short_term_memory_client:
             logger.info("Short-term memory not initialized at load time, creating now...")
-            short_term_memory_id, short_term_memory_client = create_hotel_booking_short_term_memory(logger, AWS_REGION)
+            short_term_memory_id, short_term_memory_client = load_short_term_memory()
 
-        logger.info(f"Using short-term memory: {short_term_memory_id}")
+        logger.info("Using short-term memory: %s", short_term_memory_id)
 
     except Exception as e:
-        logger.error(f"Error retrieving credentials or setting up memory: {e}")
+        logger.error("Error retrieving credentials or setting up memory: %s", e)
         return {
             "statusCode": 500,
             "headers": {"Content-Type": "application/json"},
             "body": json.dumps({"error": f"Setup error: {str(e)}"}),
         }
 
-    encoded_arn = agent_arn.replace(":", "%3A").replace("/", "%2F")
-    mcp_url = (
-        f"https://bedrock-agentcore.{AWS_REGION}.amazonaws.com/runtimes/{encoded_arn}/invocations?qualifier=DEFAULT"
-    )
+    mcp_url = get_mcp_url(agent_arn)
 
-    logger.info(f"MCP URL: {mcp_url}")
+    logger.info("MCP URL: %s", mcp_url)
 
     headers = {
         "authorization": f"Bearer {bearer_token}",
@@ -125,7 +219,9 @@ async def agent_invocation(payload, context):  # noqa: ARG001
         "Accept": "application/json, text/event-stream",
     }
 
-    bedrock_model = BedrockModel(model_id="us.anthropic.claude-sonnet-4-20250514-v1:0", client=bedrock_client)
+    # Imported on first use to keep them out of the container's cold-start import time
+    from mcp.client.streamable_http import streamablehttp_client
+    from strands.tools.mcp.mcp_client import MCPClient
 
     mcp_client = MCPClient(lambda: streamablehttp_client(mcp_url, headers=headers))
 
@@ -136,22 +232,21 @@ async def agent_invocation(payload, context):  # noqa: ARG001
             # Get the tools from the MCP client
             logger.info("Listing available tools from MCP server...")
             tools = mcp_client.list_tools_sync()
-            logger.info(f"Found {len(tools)} tools")
-
-            # Create tool descriptions for the system prompt
-            toolsDesciptions = []
-            for tool in tools:
-                # Convert display properties to string to avoid type issues
-                display_props = tool.get_display_properties()
-                if isinstance(display_props, dict):
-                    display_props = json.dumps(display_props)
-                toolsDesciptions.append(f"{tool.tool_name}: {display_props}")
-                logger.info(f"Tool: {tool.tool_name}: {display_props}")
-
-            # Enhanced system prompt with comprehensive booking capabilities and memory awareness
+            logger.info("Found %s tools", len(tools))
+
+            # Create tool descriptions for the system prompt from the live tool list
+            # Convert display properties to string to avoid type issues
+            toolsDesciptions = [
+                f"{tool.tool_name}: {json.dumps(props) if isinstance(props := tool.get_display_properties(), dict) else props}"
+                for tool in tools
+            ]
+            logger.debug("Tools: %s", toolsDesciptions)
+
+            # Enhanced system prompt with comprehensive booking capabilities and memory awareness.
+            # The formatted prompt is cached on the exact descriptions, so any tool change is picked up.
             system_prompt = get_hotel_booking_system_prompt(toolsDesciptions)
 
-            logger.info(f"System Prompt: {system_prompt}")
+            logger.info("System Prompt: %s", system_prompt)
 
             # Create memory hooks for and short-term memory
             short_term_hooks = ShortTermMemoryHooks(
@@ -174,7 +269,7 @@ async def agent_invocation(payload, context):  # noqa: ARG001
 
             # Invoke the agent with the prompt
             result = agent(prompt)
-            logger.info(f"Agent response: {result}")
+            logger.info("Agent response: %s", result)
 
             final_response = {
                 "statusCode": 200,
@@ -191,7 +286,9 @@ async def agent_invocation(payload, context):  # noqa: ARG001
             return final_response
 
         except Exception as e:
-            logger.error(f"Error in MCP tool connection: {e}")
+            logger.error("Error in MCP tool connection: %s", e)
+            import traceback
+
             logger.error(traceback.format_exc())
             response = {
                 "statusCode": 500,
@@ -5,10 +5,16 @@ This module provides the HotelBookingMemoryHooks class that automatically manage
 customer context storage and retrieval using Amazon Bedrock AgentCore Memory.
 """
 
+import functools
+import hashlib
 import logging
 import os
+import threading
+import time
 from bedrock_agentcore.memory import MemoryClient
 from bedrock_agentcore.memory.constants import StrategyType
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from strands.hooks import AfterInvocationEvent, HookProvider, HookRegistry, MessageAddedEvent
 
 
@@ -20,6 +26,49 @@ AWS_REGION = os.environ.get("AWS_DEFAULT_REGION")
 MEMORY_NAME = "HotelBookingMemory"
 MEMORY_EXPIRY_DAYS = 90
 
+# Customer context retrieval cache
+RETRIEVAL_CACHE_TTL_SECONDS = 60
+RETRIEVAL_CACHE_MAX_ENTRIES = 128
+
+# Shared pool for retrieving memory namespaces in parallel
+_retrieval_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="memory-retrieval")
+
+
+@functools.cache
+def get_memory_client(region: str) -> MemoryClient:
+    """Get a MemoryClient for the region, shared across the process."""
+    return MemoryClient(region_name=region)
+
+
+@functools.cache
+def list_memories(region: str) -> tuple[dict, ...]:
+    """
+    List memory resources in the region once per process.
+
+    Call list_memories.cache_clear() after creating a memory so the next lookup sees it.
+    """
+    return tuple(get_memory_client(region).list_memories())
+
+
+def find_memory_id(memories: tuple[dict, ...] | list[dict], memory_name: str) -> str | None:
+    """
+    Find a memory ID by name.
+
+    Args:
+        memories: Memory summaries as returned by list_memories
+        memory_name: Name of the memory to find
+
+    Returns:
+        Memory ID if found by exact name or, failing that, by an ID containing the name
+    """
+    by_name = {memory.get("name"): memory["id"] for memory in memories if "id" in memory}
+    if memory_name in by_name:
+        return by_name[memory_name]
+
+    # Fallback: check if ID contains the memory name (case insensitive)
+    memory_name_lower = memory_name.lower()
+    return next((memory["id"] for memory in memories if memory_name_lower in memory.get("id", "").lower()), None)
+
 
 def get_namespaces(mem_client: MemoryClient, memory_id: str) -> dict:
     """Get namespace mapping for memory strategies."""
@@ -47,47 +96,72 @@ class HotelBookingMemoryHooks(HookProvider):
         self.session_id = session_id
         self.logger = logger
         self.namespaces = get_namespaces(self.client, self.memory_id)
+        # actor_id is fixed for the hook's lifetime, so resolve the namespace templates once
+        self.formatted_namespaces = {
+            context_type: namespace.format(actorId=actor_id) for context_type, namespace in self.namespaces.items()
+        }
+        self._retrieval_cache: OrderedDict[tuple[str, str, str], tuple[float, list]] = OrderedDict()
+        self._retrieval_cache_lock = threading.Lock()
+
+    def _retrieve_memories(self, namespace: str, query: str) -> list:
+        """
+        Retrieve memories for a namespace, reusing recent results for the same query.
+
+        Results are kept in a small LRU cache keyed by actor, namespace and query hash
+        for RETRIEVAL_CACHE_TTL_SECONDS.
+        """
+        key = (self.actor_id, namespace, hashlib.sha256(query.encode("utf-8")).hexdigest())
+        now = time.monotonic()
+        with self._retrieval_cache_lock:
+            cached = self._retrieval_cache.get(key)
+            if cached and now - cached[0] < RETRIEVAL_CACHE_TTL_SECONDS:
+                self._retrieval_cache.move_to_end(key)
+                return cached[1]
+
+        memories = self.client.retrieve_memories(memory_id=self.memory_id, namespace=namespace, query=query, top_k=3)
+        with self._retrieval_cache_lock:
+            self._retrieval_cache[key] = (now, memories)
+            self._retrieval_cache.move_to_end(key)
+            if len(self._retrieval_cache) > RETRIEVAL_CACHE_MAX_ENTRIES:
+                self._retrieval_cache.popitem(last=False)
+        return memories
 
     def retrieve_customer_context(self, event: MessageAddedEvent):
         """
         Retrieve customer context before processing booking query.
 
-        This hook automatically injects relevant customer context from previous
-        interactions into the current query to provide personalized responses.
+        This hook automatically attaches relevant customer context from previous
+        interactions to the current query to provide personalized responses.
         """
         messages = event.agent.messages
         if messages[-1]["role"] == "user" and "toolResult" not in messages[-1]["content"][0]:
             user_query = messages[-1]["content"][0]["text"]
 
             try:
-                # Retrieve customer context from all namespaces
+                # Retrieve customer context from all namespaces in parallel
                 all_context = []
-
-                for context_type, namespace in self.namespaces.items():
-                    memories = self.client.retrieve_memories(
-                        memory_id=self.memory_id,
-                        namespace=namespace.format(actorId=self.actor_id),
-                        query=user_query,
-                        top_k=3,
+                futures = {
+                    context_type: _retrieval_executor.submit(self._retrieve_memories, namespace, user_query)
+                    for context_type, namespace in self.formatted_namespaces.items()
+                }
+
+                for context_type, future in futures.items():
+                    tag = context_type.upper()
+                    texts = (
+                        memory["content"].get("text", "").strip()
+                        for memory in future.result()
+                        if isinstance(memory, dict) and isinstance(memory.get("content"), dict)
                     )
+                    all_context.extend(f"[{tag}] {text}" for text in texts if text)
 
-                    for memory in memories:
-                        if isinstance(memory, dict):
-                            content = memory.get("content", {})
-                            if isinstance(content, dict):
-                                text = content.get("text", "").strip()
-                                if text:
-                                    all_context.append(f"[{context_type.upper()}] {text}")
-
-                # Inject customer context into the query
+                # Attach customer context as a separate content block so the query text itself is left untouched
                 if all_context:
                     context_text = "\n".join(all_context)
-                    original_text = messages[-1]["content"][0]["text"]
-                    messages[-1]["content"][0]["text"] = f"Customer Context:\n{context_text}\n\n{original_text}"
-                    self.logger.info(f"Retrieved {len(all_context)} customer context items")
+                    messages[-1]["content"].append({"text": f"Customer Context:\n{context_text}"})
+                    self.logger.info("Retrieved %s customer context items", len(all_context))
 
             except Exception as e:
-                self.logger.warn(f"Failed to retrieve customer context: {e}", "error")
+                self.logger.warning("Failed to retrieve customer context: %s", e)
 
     def save_booking_interaction(self, event: AfterInvocationEvent):
         """
@@ -100,15 +174,15 @@ class HotelBookingMemoryHooks(HookProvider):
             messages = event.agent.messages
             if len(messages) >= 2 and messages[-1]["role"] == "assistant":
                 # Get last customer query and agent response
-                customer_query = None
-                agent_response = None
-
-                for msg in reversed(messages):
-                    if msg["role"] == "assistant" and not agent_response:
-                        agent_response = msg["content"][0]["text"]
-                    elif msg["role"] == "user" and not customer_query and "toolResult" not in msg["content"][0]:
-                        customer_query = msg["content"][0]["text"]
-                        break
+                agent_response = messages[-1]["content"][0]["text"]
+                customer_query = next(
+                    (
+                        msg["content"][0]["text"]
+                        for msg in reversed(messages)
+                        if msg["role"] == "user" and "toolResult" not in msg["content"][0]
+                    ),
+                    None,
+                )
 
                 if customer_query and agent_response:
                     # Save the booking interaction
@@ -121,7 +195,7 @@ class HotelBookingMemoryHooks(HookProvider):
                     self.logger.info("Saved booking interaction to memory")
 
         except Exception as e:
-            self.logger.warn(f"Failed to save booking interaction: {e}", "error")
+            self.logger.warning("Failed to save booking interaction: %s", e)
 
     def register_hooks(self, registry: HookRegistry) -> None:
         """
@@ -135,13 +209,14 @@ class HotelBookingMemoryHooks(HookProvider):
         self.logger.info("Hotel booking memory hooks registered")
 
 
-def find_existing_memory(logger, client: MemoryClient, memory_name: str) -> str:
+def find_existing_memory(logger, client: MemoryClient, memory_name: str, memories: tuple[dict, ...] = None) -> str:
     """
     Find existing memory by name.
 
     Args:
         client: MemoryClient instance
         memory_name: Name of the memory to find
+        memories: Already listed memories (optional, lists them with client if not provided)
 
     Returns:
         Memory ID if found
@@ -150,25 +225,18 @@ def find_existing_memory(logger, client: MemoryClient, memory_name: str) -> str:
         Exception: If memory not found
     """
     try:
-        memories = client.list_memories()
-        logger.info(f"Searching through {len(memories)} existing memories for '{memory_name}'")
-
-        for memory in memories:
-            logger.info(f"Memory found: ID={memory.get('id')}, Name={memory.get('name')}")
-
-            # Check by exact name match first
-            if memory.get("name") == memory_name:
-                return memory["id"]
+        if memories is None:
+            memories = client.list_memories()
+        logger.info("Searching through %s existing memories for '%s'", len(memories), memory_name)
 
-            # Fallback: check if ID contains the memory name (case insensitive)
-            memory_id = memory.get("id", "")
-            if memory_name.lower() in memory_id.lower():
-                return memory_id
+        memory_id = find_memory_id(memories, memory_name)
+        if memory_id:
+            return memory_id
 
         raise Exception(f"No memory found with name '{memory_name}'")
 
     except Exception as e:
-        logger.warn(f"Error finding existing memory: {e}", "error")
+        logger.warning("Error finding existing memory: %s", e)
         raise
 
 
@@ -193,7 +261,7 @@ def create_or_get_memory(logger, region: str = None) -> tuple[str, MemoryClient]
 
     print(f"Using AWS region: {region}")
 
-    client = MemoryClient(region_name=region)
+    client = get_memory_client(region)
 
     # Define memory strategies for hotel booking
     strategies = [
@@ -217,11 +285,11 @@ def create_or_get_memory(logger, region: str = None) -> tuple[str, MemoryClient]
 
     # If memory already exists, find and return it
     try:
-        memory_id = find_existing_memory(logger, client, MEMORY_NAME)
-        logger.info(f"✅ Found existing memory: {memory_id}")
+        memory_id = find_existing_memory(logger, client, MEMORY_NAME, list_memories(region))
+        logger.info("✅ Found existing memory: %s", memory_id)
         return memory_id, client
     except Exception as find_error:
-        logger.warn(f"❌ Error finding existing memory: {find_error}")
+        logger.warning("❌ Error finding existing memory: %s", find_error)
 
     try:
         if not memory_id:
@@ -232,8 +300,9 @@ def create_or_get_memory(logger, region: str = None) -> tuple[str, MemoryClient]
                 event_expiry_days=MEMORY_EXPIRY_DAYS,
             )
             memory_id = memory["id"]
-            logger.info(f"✅ Created memory: {memory_id}")
+            list_memories.cache_clear()
+            logger.info("✅ Created memory: %s", memory_id)
             return memory_id, client
     except Exception as e:
-        logger.warn(f"❌ ERROR: {e}", "error")
+        logger.warning("❌ ERROR: %s", e)
         raise
@@ -6,11 +6,16 @@ short-term memory capabilities. It stores raw conversation turns that can be ret
 with get_last_k_turns for seamless conversation continuation.
 """
 
+import atexit
 import logging
 import os
+import queue
+import threading
+import time
 from bedrock_agentcore.memory import MemoryClient
 from botocore.exceptions import ClientError
-from strands.hooks import AgentInitializedEvent, HookProvider, HookRegistry, MessageAddedEvent
+from memory.memory_hooks import find_memory_id, get_memory_client, list_memories
+from strands.hooks import AfterInvocationEvent, AgentInitializedEvent, HookProvider, HookRegistry, MessageAddedEvent
 from typing import Any
 
 
@@ -23,6 +28,108 @@ AWS_REGION = os.environ.get("AWS_DEFAULT_REGION")
 SHORT_TERM_MEMORY_NAME = "HotelBookingShortTermMemory"
 SHORT_TERM_MEMORY_EXPIRY_DAYS = 7  # Short retention for conversation history
 DEFAULT_CONVERSATION_TURNS = 10  # Number of recent turns to load
+MAX_PENDING_EVENTS = 1000  # Events waiting to be written before new ones are dropped
+DEFAULT_MAX_BATCH_SIZE = 5  # Messages combined into one create_event call
+DEFAULT_BATCH_INTERVAL_SECONDS = 2.0  # Oldest buffered message age that forces a flush
+NO_CONVERSATION_HISTORY = "No conversation history available."  # Returned when there are no turns
+EXIT_FLUSH_TIMEOUT_SECONDS = 10.0  # Longest interpreter exit waits for pending events to be written
+
+# Queued after the pending events to tell the writer thread to stop
+_STOP_WRITER = object()
+
+
+class MemoryEventWriter:
+    """
+    Background writer for short-term memory events.
+
+    Keeps create_event calls off the agent's message loop by handing them to
+    a single daemon thread. Pending events are flushed at interpreter exit,
+    waiting at most EXIT_FLUSH_TIMEOUT_SECONDS.
+    """
+
+    def __init__(self, max_pending: int = MAX_PENDING_EVENTS):
+        """
+        Initialize the writer and start its worker thread.
+
+        Args:
+            max_pending: Maximum number of events waiting to be written
+        """
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._run, name="short-term-memory-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(
+        self, memory_client: MemoryClient, memory_id: str, actor_id: str, session_id: str, messages: list[tuple]
+    ) -> bool:
+        """
+        Queue messages to be stored as a single memory event.
+
+        Returns:
+            True if queued, False if the queue was full and the messages were dropped
+        """
+        try:
+            self._queue.put_nowait((memory_client, memory_id, actor_id, session_id, messages))
+            return True
+        except queue.Full:
+            logger.warning("❌ Short-term memory write queue full, dropping %s messages", len(messages))
+            return False
+
+    def close(self, timeout: float = EXIT_FLUSH_TIMEOUT_SECONDS):
+        """
+        Stop the worker once the events already queued are written.
+
+        Waits at most timeout seconds, so a hung create_event call or a dead
+        worker cannot keep the process from exiting.
+        """
+        if not self._thread.is_alive():
+            return
+
+        deadline = time.monotonic() + timeout
+        try:
+            self._queue.put(_STOP_WRITER, timeout=timeout)
+        except queue.Full:
+            logger.warning("❌ Short-term memory write queue still full after %ss, pending events lost", timeout)
+            return
+
+        self._thread.join(timeout=max(0.0, deadline - time.monotonic()))
+        if self._thread.is_alive():
+            logger.warning("❌ Short-term memory writer did not finish within %ss, pending events may be lost", timeout)
+
+    def _run(self):
+        """Worker loop that writes queued events to memory until it reads the stop marker"""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP_WRITER:
+                    return
+                memory_client, memory_id, actor_id, session_id, messages = item
+                memory_client.create_event(
+                    memory_id=memory_id, actor_id=actor_id, session_id=session_id, messages=messages
+                )
+                logger.info("✅ Stored %s messages in short-term memory", len(messages))
+                if logger.isEnabledFor(logging.DEBUG):
+                    for content_text, role in messages:
+                        logger.debug("Stored %s message: %s", role.lower(), content_text[:80])
+            except Exception as e:
+                logger.warning("❌ Error storing message in memory: %s", e)
+                # Don't fail the conversation if memory storage fails
+            finally:
+                self._queue.task_done()
+
+
+_event_writer: MemoryEventWriter | None = None
+_event_writer_lock = threading.Lock()
+
+
+def get_event_writer() -> MemoryEventWriter:
+    """Get the process-wide memory event writer, starting it on first use"""
+    global _event_writer
+    if _event_writer is None:
+        with _event_writer_lock:
+            if _event_writer is None:
+                _event_writer = MemoryEventWriter()
+    return _event_writer
 
 
 class ShortTermMemoryHooks(HookProvider):
@@ -31,7 +138,7 @@ class ShortTermMemoryHooks(HookProvider):
 
     Provides conversation history continuity by:
     1. Loading recent conversation turns when agent initializes
-    2. Storing new messages as they are added
+    2. Storing new messages as they are added, batched into as few events as possible
     """
 
     def __init__(
@@ -42,6 +149,9 @@ class ShortTermMemoryHooks(HookProvider):
         session_id: str,
         logger,
         conversation_turns: int = DEFAULT_CONVERSATION_TURNS,
+        event_writer: MemoryEventWriter | None = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        batch_interval: float = DEFAULT_BATCH_INTERVAL_SECONDS,
     ):
         """
         Initialize short-term memory hooks.
@@ -53,6 +163,9 @@ class ShortTermMemoryHooks(HookProvider):
             session_id: Unique identifier for the current session
             logger: Logger instance to use
             conversation_turns: Number of recent conversation turns to load (default: 5)
+            event_writer: Writer used to store messages in the background (default: shared writer)
+            max_batch_size: Number of buffered messages that triggers a write
+            batch_interval: Seconds after the first buffered message that triggers a write
         """
         self.memory_client = memory_client
         self.memory_id = memory_id
@@ -60,6 +173,11 @@ class ShortTermMemoryHooks(HookProvider):
         self.session_id = session_id
         self.conversation_turns = conversation_turns
         self.logger = logger
+        self.event_writer = event_writer or get_event_writer()
+        self.max_batch_size = max_batch_size
+        self.batch_interval = batch_interval
+        self._pending_messages: list[tuple[str, str]] = []
+        self._pending_since = 0.0
 
     def on_agent_initialized(self, event: AgentInitializedEvent):
         """
@@ -69,7 +187,9 @@ class ShortTermMemoryHooks(HookProvider):
         and adds them to the agent's system prompt for context continuity.
         """
         try:
-            self.logger.info(f"Loading last {self.conversation_turns} conversation turns for session {self.session_id}")
+            self.logger.info(
+                "Loading last %s conversation turns for session %s", self.conversation_turns, self.session_id
+            )
 
             # Load recent conversation turns from memory
             recent_turns = self.memory_client.get_last_k_turns(
@@ -77,28 +197,25 @@ class ShortTermMemoryHooks(HookProvider):
             )
 
             if recent_turns:
-                context_messages = []
-                for turn in recent_turns:
-                    for message in turn:
-                        role = message["role"]
-                        content = message["content"]["text"]
-                        context_messages.append(f"{role}: {content}")
-
-                context = "\n".join(context_messages)
-                self.logger.info(f"Context from memory: {context}")
+                context = "\n".join(
+                    f"{message['role']}: {message['content']['text']}" for turn in recent_turns for message in turn
+                )
+                self.logger.info("Context from memory: %s", context)
 
                 # Add context to agent's system prompt
                 event.agent.system_prompt += f"\n\nRecent conversation history:\n{context}\n\nContinue the conversation naturally based on this context."
-                self.logger.info(f"Added context to system prompt: {event.agent.system_prompt}")
+                self.logger.info("Added context to system prompt: %s", event.agent.system_prompt)
 
                 self.logger.info(
-                    f"✅ Loaded {len(recent_turns)} conversation turns with {len(context_messages)} messages"
+                    "✅ Loaded %s conversation turns with %s messages",
+                    len(recent_turns),
+                    sum(len(turn) for turn in recent_turns),
                 )
             else:
                 self.logger.info("No conversation messages found in recent turns")
 
         except Exception as e:
-            self.logger.warning(f"❌ Error loading conversation history: {str(e)}")
+            self.logger.warning("❌ Error loading conversation history: %s", e)
             # Don't fail the agent initialization if memory loading fails
 
     def on_message_added(self, event: MessageAddedEvent):
@@ -106,6 +223,9 @@ class ShortTermMemoryHooks(HookProvider):
         Store new messages in short-term memory.
 
         This hook automatically saves each new message to memory for future retrieval.
+        Messages are buffered and written as one event once the batch is full, the
+        batch interval has passed, or the invocation ends. The write happens on a
+        background thread so the agent does not wait on it.
         """
         try:
             messages = event.agent.messages
@@ -117,32 +237,48 @@ class ShortTermMemoryHooks(HookProvider):
             content = last_message.get("content", "")
 
             # Extract text content if it's in a structured format
-            if isinstance(content, list) and len(content) > 0:
-                if isinstance(content[0], dict) and "text" in content[0]:
-                    content_text = content[0]["text"]
-                else:
-                    content_text = str(content[0])
-            elif isinstance(content, dict) and "text" in content:
-                content_text = content["text"]
-            else:
-                content_text = str(content)
-
-            # messages_to_be_stored = [(str(messages[-1].get("content", "")), messages[-1]["role"])]
-            # Store the message in memory
-            self.memory_client.create_event(
-                memory_id=self.memory_id,
-                actor_id=self.actor_id,
-                session_id=self.session_id,
-                messages=[(content_text, role.upper())],
-                # messages=messages_to_be_stored
-            )
+            match content:
+                case str():
+                    content_text = content
+                case [{"toolResult": _}, *_] | [{"toolUse": _}, *_]:
+                    # Tool calls and results are intermediate steps, not conversation history
+                    return
+                case [{"text": text}, *_] | {"text": text}:
+                    content_text = text
+                case [first, *_]:
+                    content_text = str(first)
+                case _:
+                    content_text = str(content)
+
+            if not content_text.strip():
+                return
+
+            if not self._pending_messages:
+                self._pending_since = time.monotonic()
+            self._pending_messages.append((content_text, role.upper()))
 
-            self.logger.info(f"✅ Stored {role} message {content_text} in short-term memory")
+            if (
+                len(self._pending_messages) >= self.max_batch_size
+                or time.monotonic() - self._pending_since >= self.batch_interval
+            ):
+                self.flush_pending_messages()
 
         except Exception as e:
-            self.logger.warning(f"❌ Error storing message in memory: {e}")
+            self.logger.warning("❌ Error storing message in memory: %s", e)
             # Don't fail the conversation if memory storage fails
 
+    def flush_pending_messages(self, event: AfterInvocationEvent | None = None):
+        """
+        Queue all buffered messages to be stored in memory as a single event.
+
+        Registered for AfterInvocationEvent so nothing is left buffered between invocations.
+        """
+        if not self._pending_messages:
+            return
+
+        messages, self._pending_messages = self._pending_messages, []
+        self.event_writer.submit(self.memory_client, self.memory_id, self.actor_id, self.session_id, messages)
+
     def register_hooks(self, registry: HookRegistry) -> None:
         """
         Register short-term memory hooks with the agent.
@@ -152,11 +288,12 @@ class ShortTermMemoryHooks(HookProvider):
         """
         registry.add_callback(AgentInitializedEvent, self.on_agent_initialized)
         registry.add_callback(MessageAddedEvent, self.on_message_added)
+        registry.add_callback(AfterInvocationEvent, self.flush_pending_messages)
         self.logger.info("✅ Short-term memory hooks registered")
 
 
 def create_short_term_memory(
-    logger, region: str = None, memory_name: str = None, expiry_days: int = None
+    logger, region: str = None, memory_name: str = None, expiry_days: int = None, memory_id: str = None
 ) -> tuple[str, MemoryClient]:
     """
     Create or get existing short-term memory resource for hotel booking agent.
@@ -165,6 +302,7 @@ def create_short_term_memory(
         region: AWS region (optional, uses global AWS_REGION if not provided)
         memory_name: Name for the memory resource (optional, uses default)
         expiry_days: Days before memories expire (optional, uses default)
+        memory_id: Previously resolved memory ID (optional); reused without listing memories if still active
 
     Returns:
         Tuple of (memory_id, memory_client)
@@ -184,29 +322,32 @@ def create_short_term_memory(
     if not expiry_days:
         expiry_days = SHORT_TERM_MEMORY_EXPIRY_DAYS
 
-    client = MemoryClient(region_name=region)
+    client = get_memory_client(region)
+
+    if memory_id:
+        try:
+            status = client.get_memory_status(memory_id)
+            if status == "ACTIVE":
+                logger.info("✅ Reusing known short-term memory: %s", memory_id)
+                return memory_id, client
+            logger.info("Known short-term memory %s is %s, searching by name", memory_id, status)
+        except Exception as e:
+            # Any failure to validate the known ID falls back to searching by name
+            logger.info("Known short-term memory %s is unavailable, searching by name: %s", memory_id, e)
 
     try:
         # First try to find existing memory
-        memories = client.list_memories()
-        logger.info(f"Searching through {len(memories)} existing memories for '{memory_name}'")
-
-        memory_id = None
-        for memory in memories:
-            if memory.get("name") == memory_name:
-                memory_id = memory["id"]
-                break
-            # Fallback: check if ID contains the memory name
-            elif memory_name.lower() in memory.get("id", "").lower():
-                memory_id = memory["id"]
-                break
+        memories = list_memories(region)
+        logger.info("Searching through %s existing memories for '%s'", len(memories), memory_name)
+
+        memory_id = find_memory_id(memories, memory_name)
 
         if memory_id:
-            logger.info(f"✅ Found existing short-term memory: {memory_id}")
+            logger.info("✅ Found existing short-term memory: %s", memory_id)
             return memory_id, client
 
         # If not found, create new memory
-        logger.info(f"Creating new short-term memory: {memory_name}")
+        logger.info("Creating new short-term memory: %s", memory_name)
         memory = client.create_memory_and_wait(
             name=memory_name,
             strategies=[],  # No strategies for short-term memory - stores raw events only
@@ -214,14 +355,15 @@ def create_short_term_memory(
             event_expiry_days=expiry_days,
         )
         memory_id = memory["id"]
-        logger.info(f"✅ Created short-term memory: {memory_id}")
+        list_memories.cache_clear()
+        logger.info("✅ Created short-term memory: %s", memory_id)
         return memory_id, client
 
     except ClientError as e:
-        logger.warning(f"❌ Error accessing memory service: {e}")
+        logger.warning("❌ Error accessing memory service: %s", e)
         raise
     except Exception as e:
-        logger.warning(f"❌ Unexpected error: {e}")
+        logger.warning("❌ Unexpected error: %s", e)
         raise
 
 
@@ -246,13 +388,13 @@ def get_conversation_history(
             memory_id=memory_id, actor_id=actor_id, session_id=session_id, k=k
         )
 
-        logger.info(f"Retrieved {len(recent_turns)} conversation turns from memory")
+        logger.info("Retrieved %s conversation turns from memory", len(recent_turns))
 
         conversation_history = format_conversation_history(recent_turns)
         return conversation_history
 
     except Exception as e:
-        logger.warning(f"❌ Error retrieving conversation history: {e}")
+        logger.warning("❌ Error retrieving conversation history: %s", e)
         return []
 
 
@@ -267,7 +409,7 @@ def format_conversation_history(conversation_turns: list[dict[str, Any]]) -> str
         Formatted conversation history as string
     """
     if not conversation_turns:
-        return "No conversation history available."
+        return NO_CONVERSATION_HISTORY
 
     formatted_messages = []
     for _turn_idx, turn in enumerate(conversation_turns, start=1):
@@ -283,6 +425,10 @@ def format_conversation_history(conversation_turns: list[dict[str, Any]]) -> str
 
 
 # Convenience function for hotel booking agent
-def create_hotel_booking_short_term_memory(logger, region: str = None) -> tuple[str, MemoryClient]:
+def create_hotel_booking_short_term_memory(
+    logger, region: str = None, memory_id: str = None
+) -> tuple[str, MemoryClient]:
     """Create short-term memory specifically for hotel booking agent"""
-    return create_short_term_memory(logger, region=region, memory_name="HotelBookingShortTermMemory", expiry_days=7)
+    return create_short_term_memory(
+        logger, region=region, memory_name="HotelBookingShortTermMemory", expiry_days=7, memory_id=memory_id
+    )
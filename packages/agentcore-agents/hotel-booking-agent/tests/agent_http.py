@@ -0,0 +1,211 @@
+"""
+Shared HTTP session setup and local caches for the hotel booking agent test scripts
+"""
+
+import functools
+import json
+import logging
+import os
+import requests
+import sys
+import time
+import urllib.parse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+try:
+    import orjson as fast_json  # noqa: F401 - re-exported for the test scripts
+except ImportError:  # orjson is optional; fall back to the standard library
+    import json as fast_json  # noqa: F401
+
+
+logger = logging.getLogger(__name__)
+
+# Pass --force-refresh to ignore the bearer token and agent ARN cached by a previous run
+FORCE_REFRESH = "--force-refresh" in sys.argv
+
+# Set HB_LOCAL=1 to test an agent running locally instead of the deployed AgentCore runtime
+LOCAL_AGENT_URL = "http://0.0.0.0:8080/invocations"
+
+AGENT_ARN_PARAMETER = "/hotel_booking_agent/runtime/agent_arn"
+COGNITO_SECRET_NAME = "hotel_booking_agent/cognito/credentials"
+
+# Headers sent with every request; AgentCore requests also carry a bearer token
+JSON_HEADERS = {"Content-Type": "application/json"}
+STREAM_HEADERS = {
+    "Content-Type": "application/json, text/event-stream",
+    "Accept": "application/json, text/event-stream",
+}
+
+# SSM parameter values persisted between runs of the local test scripts
+PARAMETER_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "hotel_booking_agent", "parameters.json")
+PARAMETER_CACHE_TTL_SECONDS = 3600
+
+# Bearer token persisted between runs of the local test scripts
+TOKEN_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "hotel_booking_agent", "token.json")
+
+
+def create_agent_session(headers):
+    """
+    Create a keep-alive HTTP session for invoking the agent.
+
+    Agent invocations are non-idempotent POSTs: by the time a 5xx or a read timeout comes back the
+    agent may already have run tools such as create_reservation, so those are never retried. Only
+    connection failures and 429 throttling, where the request was not processed, are retried.
+
+    Args:
+        headers: Headers sent with every request
+
+    Returns:
+        Configured requests.Session
+    """
+    http = requests.Session()
+    http.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                connect=3,
+                read=0,
+                other=0,
+                backoff_factor=0.2,
+                status_forcelist=[429],
+                allowed_methods=["POST"],
+                raise_on_status=False,
+            ),
+        ),
+    )
+    http.headers.update(headers)
+    return http
+
+
+def get_cached_parameter(
+    name: str,
+    region: str,
+    force_refresh: bool = False,
+    ttl: float = PARAMETER_CACHE_TTL_SECONDS,
+    cache_path: str = PARAMETER_CACHE_PATH,
+) -> str:
+    """
+    Get an SSM parameter value, reusing the value saved on disk by an earlier run for up to ttl seconds.
+    Used by the test scripts so repeated runs skip the SSM round trip.
+
+    Args:
+        name: SSM parameter name
+        region: AWS region the parameter lives in
+        force_refresh: Ignore the saved value and read the parameter again
+        ttl: Seconds a saved value stays valid
+        cache_path: File the parameter values are saved to
+
+    Returns:
+        Parameter value
+    """
+    key = f"{region}:{name}"
+    try:
+        with open(cache_path) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        cached = {}
+    if not isinstance(cached, dict):
+        cached = {}
+
+    entry = cached.get(key)
+    if not force_refresh and isinstance(entry, dict) and time.time() - entry.get("fetched_at", 0) < ttl:
+        return entry["value"]
+
+    # Imported here so local runs that never read SSM do not load the AWS SDK
+    from common.aws_config import AWSConfig
+
+    ssm_client = AWSConfig().get_session().client("ssm", region_name=region)
+    value = ssm_client.get_parameter(Name=name)["Parameter"]["Value"]
+
+    cached[key] = {"value": value, "fetched_at": time.time()}
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(cached, f)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        logger.warning("Failed to save SSM parameter cache to %s: %s", cache_path, e)
+
+    return value
+
+
+def get_cached_token(
+    secret_name: str = "hotel_booking_agent/cognito/credentials",
+    force_refresh: bool = False,
+    cache_path: str = TOKEN_CACHE_PATH,
+) -> str:
+    """
+    Get a bearer token, reusing the one saved on disk by an earlier run while it is still valid.
+    Used by the test scripts so repeated runs skip the Secrets Manager and Cognito round trips.
+
+    Args:
+        secret_name: AWS Secrets Manager secret name containing Cognito credentials
+        force_refresh: Ignore the saved token and authenticate again
+        cache_path: File the token and its expiry are saved to
+
+    Returns:
+        Bearer token string
+    """
+    if not force_refresh:
+        try:
+            with open(cache_path) as f:
+                cached = json.load(f)
+            if cached["secret_name"] == secret_name and time.time() < cached["expires_at"]:
+                return cached["token"]
+        except (OSError, KeyError, TypeError, ValueError):
+            pass
+
+    # Imported here so local runs that never authenticate do not load the AWS SDK
+    from common.cognito_token_manager import CognitoTokenManager
+
+    token_manager = CognitoTokenManager(secret_name=secret_name)
+    token = token_manager.get_fresh_token()
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        # The file holds a live bearer token, so keep it readable by the current user only
+        with os.fdopen(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+            json.dump({"secret_name": secret_name, "token": token, "expires_at": token_manager.token_expiry}, f)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        logger.warning("Failed to save bearer token to %s: %s", cache_path, e)
+
+    return token
+
+
+@functools.lru_cache(maxsize=4)
+def _agentcore_agent_url(region):
+    """Look up the agent ARN and build its AgentCore invocation URL once per region"""
+    agent_arn = get_cached_parameter(AGENT_ARN_PARAMETER, region, force_refresh=FORCE_REFRESH)
+    encoded_arn = urllib.parse.quote(agent_arn, safe="")
+    return agent_arn, f"https://bedrock-agentcore.{region}.amazonaws.com/runtimes/{encoded_arn}/invocations"
+
+
+def resolve_agent_endpoint(local=False, base_headers=JSON_HEADERS):
+    """
+    Resolve where to send agent invocations and the headers to send with them.
+
+    Args:
+        local: Use the agent running locally at LOCAL_AGENT_URL instead of AgentCore
+        base_headers: Headers for AgentCore requests; the bearer token is added to these
+
+    Returns:
+        Tuple of (region, agent_arn, url, headers); region and agent_arn are None for a local agent
+    """
+    if local:
+        return None, None, LOCAL_AGENT_URL, dict(JSON_HEADERS)
+
+    # Imported here so local runs do not load the AWS SDK
+    from boto3.session import Session
+
+    region = Session().region_name
+    agent_arn, url = _agentcore_agent_url(region)
+    bearer_token = get_cached_token(COGNITO_SECRET_NAME, force_refresh=FORCE_REFRESH)
+    return region, agent_arn, url, {**base_headers, "authorization": f"Bearer {bearer_token}"}
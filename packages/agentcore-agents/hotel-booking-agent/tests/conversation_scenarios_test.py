@@ -6,14 +6,13 @@ This script runs predefined conversation scenarios to test various
 hotel booking agent capabilities including memory and context handling.
 """
 
-import boto3
-import json
+import io
 import os
-import requests
 import sys
+import threading
 import time
 import uuid
-from boto3.session import Session
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 # Add parent directory to path to import from common and memory modules
@@ -22,34 +21,51 @@ parent_dir = os.path.dirname(current_dir)
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from common.cognito_token_manager import CognitoTokenManager  # noqa: E402
+# tests.agent_http imports boto3 and the common modules where they are first used,
+# so local runs (HB_LOCAL=1) never load the AWS SDK
+from tests.agent_http import create_agent_session, fast_json, resolve_agent_endpoint  # noqa: E402
+
+
+# Only the most recent turns are sent back with each message; the agent keeps full history in memory
+HISTORY_WINDOW = 4
+
+# Optional pause between messages when following a scenario live, e.g. HB_TEST_DELAY=2
+MESSAGE_DELAY_SECONDS = float(os.environ.get("HB_TEST_DELAY", "0"))
+
+
+_output_lock = threading.Lock()
+
+
+def _write_block(text):
+    """Write a block of output with a single write and flush"""
+    with _output_lock:
+        sys.stdout.write(text)
+        sys.stdout.flush()
 
 
 class ConversationScenarioTester:
+    __slots__ = ("local", "region", "agent_arn", "url", "headers", "http", "history_window")
+
     def __init__(self):
-        self.session = Session()
-        self.region = self.session.region_name
+        self.local = os.environ.get("HB_LOCAL", "0") == "1"
+        self.region = None
+        self.agent_arn = None
+        self.history_window = HISTORY_WINDOW
         self._setup_connection()
 
     def _setup_connection(self):
         """Setup connection to AgentCore service"""
         try:
-            ssm_client = boto3.client("ssm", region_name=self.region)
-            agent_arn_response = ssm_client.get_parameter(Name="/hotel_booking_agent/runtime/agent_arn")
-            self.agent_arn = agent_arn_response["Parameter"]["Value"]
-
-            encoded_arn = self.agent_arn.replace(":", "%3A").replace("/", "%2F")
-            self.url = f"https://bedrock-agentcore.{self.region}.amazonaws.com/runtimes/{encoded_arn}/invocations"
-
-            token_manager = CognitoTokenManager(secret_name="hotel_booking_agent/cognito/credentials")
-            self.bearer_token = token_manager.get_fresh_token()
+            self.region, self.agent_arn, self.url, self.headers = resolve_agent_endpoint(self.local)
 
-            self.headers = {"authorization": f"Bearer {self.bearer_token}", "Content-Type": "application/json"}
+            # Reuse one keep-alive connection for every turn instead of a new TLS handshake per request
+            self.http = create_agent_session(self.headers)
 
-            self.url = "http://0.0.0.0:8080/invocations"
-            self.headers = {"Content-Type": "application/json"}
-
-            print(f"✅ Connected to AgentCore in region: {self.region}")
+            print(
+                f"✅ Using local agent at {self.url}"
+                if self.local
+                else f"✅ Connected to AgentCore in region: {self.region}"
+            )
 
         except Exception as e:
             print(f"❌ Connection setup failed: {e}")
@@ -58,27 +74,28 @@ class ConversationScenarioTester:
     def send_message(self, prompt, conversation_id, chat_history):
         """Send message and return response"""
         try:
-            payload = json.dumps(
-                {
-                    "prompt": prompt,
-                    "conversation_id": conversation_id,
-                    "chat_history": json.dumps(chat_history) if chat_history else "",
-                }
+            # chat_history is sent as a plain JSON array rather than a JSON string nested in the payload
+            payload = fast_json.dumps(
+                {"prompt": prompt, "conversation_id": conversation_id, "chat_history": chat_history or []}
             )
 
-            response = requests.post(self.url, headers=self.headers, data=payload)
+            response = self.http.post(self.url, data=payload)
 
             if response.status_code == 200:
-                response_data = response.json()
+                response_data = fast_json.loads(response.content)
 
-                # Parse nested response structure
+                # Parse nested response structure; the body is a JSON string unless already decoded
                 if "body" in response_data:
-                    body_data = json.loads(response_data["body"])
-                    if "message" in body_data and "content" in body_data["message"]:
-                        content = body_data["message"]["content"]
-                        if isinstance(content, list) and len(content) > 0:
-                            return content[0].get("text", "No text content")
-                    return body_data.get("message", "No message in body")
+                    body_data = response_data["body"]
+                    if isinstance(body_data, (str, bytes)):
+                        body_data = fast_json.loads(body_data)
+                    match body_data:
+                        case {"message": {"content": [{"text": text}, *_]}}:
+                            return text
+                        case {"message": {"content": [_, *_]}}:
+                            return "No text content"
+                        case _:
+                            return body_data.get("message", "No message in body")
 
                 return response_data.get("response", "No response field")
             else:
@@ -87,36 +104,42 @@ class ConversationScenarioTester:
         except Exception as e:
             return f"Request failed: {e}"
 
-    def run_scenario(self, scenario_name, messages, delay=2):
-        """Run a conversation scenario"""
-        print(f"\n{'=' * 60}")
-        print(f"🎭 SCENARIO: {scenario_name}")
-        print(f"{'=' * 60}")
+    def run_scenario(self, scenario_name, messages, delay=MESSAGE_DELAY_SECONDS):
+        """Run a conversation scenario and return its (user, agent) message pairs"""
+        _write_block(f"\n{'=' * 60}\n🎭 SCENARIO: {scenario_name}\n{'=' * 60}\n")
 
-        conversation_id = str(uuid.uuid4())
-        chat_history = []
+        conversation_id = uuid.uuid4().hex
+        user_messages = []
+        agent_messages = []
 
         for i, message in enumerate(messages, 1):
-            print(f"\n{i}. 👤 User: {message}")
-            print("   🤖 Agent: ", end="", flush=True)
-
+            recent_turns = zip(
+                user_messages[-self.history_window :], agent_messages[-self.history_window :], strict=True
+            )
+            chat_history = [
+                {"user": user_message, "agent": agent_message} for user_message, agent_message in recent_turns
+            ]
             response = self.send_message(message, conversation_id, chat_history)
-            print(response)
+
+            # Each turn is written as one block so concurrent scenarios do not interleave mid-turn
+            turn_output = io.StringIO()
+            turn_output.write(f"\n[{scenario_name}] {i}. 👤 User: {message}\n")
+            turn_output.write(f"   🤖 Agent: {response}\n")
+            _write_block(turn_output.getvalue())
 
             # Update history
-            chat_history.append({"user": message, "agent": response})
+            user_messages.append(message)
+            agent_messages.append(response)
 
-            # Delay between messages
-            if i < len(messages):
+            # Optional delay between messages
+            if delay and i < len(messages):
                 time.sleep(delay)
 
-        print(f"\n✅ Scenario '{scenario_name}' completed")
-        return chat_history
+        _write_block(f"\n✅ Scenario '{scenario_name}' completed\n")
+        return list(zip(user_messages, agent_messages, strict=True))
 
 
 def main():
-    tester = ConversationScenarioTester()
-
     # Scenario 1: Basic Hotel Search and Booking
     scenario1_messages = [
         "Hi! I'm planning a trip to New York City.",
@@ -167,15 +190,20 @@ def main():
     print("🚀 Starting Hotel Booking Agent Conversation Tests")
     print(f"⏰ Test started at: {time.strftime('%Y-%m-%d %H:%M:%S')}")
 
-    for scenario_name, messages in scenarios:
-        try:
-            tester.run_scenario(scenario_name, messages)
-        except Exception as e:
-            print(f"❌ Scenario '{scenario_name}' failed: {e}")
-
-        # Pause between scenarios
-        print("\n" + "-" * 40)
-        time.sleep(3)
+    # Scenarios use separate conversations, so they run concurrently. Each gets its own tester
+    # (and HTTP session); turns within a scenario stay sequential because the agent is stateful.
+    testers = [ConversationScenarioTester() for _ in scenarios]
+    with ThreadPoolExecutor(max_workers=len(scenarios)) as executor:
+        futures = {
+            executor.submit(tester.run_scenario, scenario_name, messages): scenario_name
+            for tester, (scenario_name, messages) in zip(testers, scenarios, strict=True)
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"❌ Scenario '{futures[future]}' failed: {e}")
+            print("\n" + "-" * 40)
 
     print(f"\n🏁 All scenarios completed at: {time.strftime('%Y-%m-%d %H:%M:%S')}")
 
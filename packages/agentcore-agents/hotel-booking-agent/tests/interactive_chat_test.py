@@ -6,13 +6,9 @@ This script provides a back-and-forth conversation interface to test
 the hotel booking agent's chatbot functionality with memory persistence.
 """
 
-import boto3
-import json
 import os
-import requests
 import sys
 import uuid
-from boto3.session import Session
 
 
 # Add parent directory to path to import from common and memory modules
@@ -21,18 +17,38 @@ parent_dir = os.path.dirname(current_dir)
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from common.cognito_token_manager import CognitoTokenManager  # noqa: E402
+# tests.agent_http imports boto3 and the common modules where they are first used,
+# so local runs (HB_LOCAL=1) never load the AWS SDK
+from tests.agent_http import STREAM_HEADERS, create_agent_session, fast_json, resolve_agent_endpoint  # noqa: E402
 
 
 class HotelBookingChatTester:
+    __slots__ = (
+        "local",
+        "region",
+        "agent_arn",
+        "url",
+        "headers",
+        "http",
+        "conversation_id",
+        "customer_id",
+        "user_messages",
+        "agent_messages",
+        "_commands",
+    )
+
     def __init__(self):
-        self.session = Session()
-        self.region = self.session.region_name
-        self.conversation_id = str(uuid.uuid4())
-        self.customer_id = str(uuid.uuid4())
-        self.chat_history = []  # Initialize chat history
+        self.local = os.environ.get("HB_LOCAL", "0") == "1"
+        self.region = None
+        self.agent_arn = None
+        self.conversation_id = uuid.uuid4().hex
+        self.customer_id = uuid.uuid4().hex
+        # Chat history kept as parallel lists of user and agent messages
+        self.user_messages = []
+        self.agent_messages = []
+        # Special chat commands; "quit" has no handler because it ends the loop
+        self._commands = {"quit": None, "history": self._show_history, "clear": self._clear_conversation}
 
-        print(f"🌍 Using AWS region: {self.region}")
         print(f"💬 Conversation ID: {self.conversation_id}")
         print(f"💬 Customer ID: {self.customer_id}")
 
@@ -42,30 +58,16 @@ class HotelBookingChatTester:
     def _setup_connection(self):
         """Setup connection to AgentCore service"""
         try:
-            # Get agent ARN from parameter store
-            ssm_client = boto3.client("ssm", region_name=self.region)
-            agent_arn_response = ssm_client.get_parameter(Name="/hotel_booking_agent/runtime/agent_arn")
-            self.agent_arn = agent_arn_response["Parameter"]["Value"]
-            print(f"🤖 Agent ARN: {self.agent_arn}")
-
-            # Setup URL
-            encoded_arn = self.agent_arn.replace(":", "%3A").replace("/", "%2F")
-            self.url = f"https://bedrock-agentcore.{self.region}.amazonaws.com/runtimes/{encoded_arn}/invocations"
-
-            # Get authentication token
-            token_manager = CognitoTokenManager(secret_name="hotel_booking_agent/cognito/credentials")
-            self.bearer_token = token_manager.get_fresh_token()
-            print("🔐 Authentication token retrieved")
-
-            # Setup headers
-            self.headers = {
-                "authorization": f"Bearer {self.bearer_token}",
-                "Content-Type": "application/json, text/event-stream",
-                "Accept": "application/json, text/event-stream",
-            }
-
-            # self.url="http://0.0.0.0:8080/invocations"
-            # self.headers = {"Content-Type": "application/json"}
+            self.region, self.agent_arn, self.url, self.headers = resolve_agent_endpoint(self.local, STREAM_HEADERS)
+            if self.local:
+                print(f"🤖 Using local agent at {self.url}")
+            else:
+                print(f"🌍 Using AWS region: {self.region}")
+                print(f"🤖 Agent ARN: {self.agent_arn}")
+                print("🔐 Authentication token retrieved")
+
+            # Reuse one keep-alive connection for every turn instead of a new TLS handshake per request
+            self.http = create_agent_session(self.headers)
 
         except Exception as e:
             print(f"❌ Error setting up connection: {e}")
@@ -75,34 +77,35 @@ class HotelBookingChatTester:
         """Send a message to the agent and get response"""
         try:
             # Prepare payload with conversation history
-            payload = json.dumps(
-                {"prompt": prompt, "session_id": self.conversation_id, "customer_id": self.customer_id}
-            )
-
-            print(f"Sending Payload:{payload}")
+            request_body = {"prompt": prompt, "session_id": self.conversation_id, "customer_id": self.customer_id}
+            payload = fast_json.dumps(request_body)
 
             # Send request
-            response = requests.post(self.url, headers=self.headers, data=payload)
+            response = self.http.post(self.url, data=payload)
 
             if response.status_code == 200:
-                response_data = response.json()
+                response_data = fast_json.loads(response.content)
 
-                # Parse nested response structure
+                # Parse nested response structure; the body is a JSON string unless already decoded
                 if "body" in response_data:
-                    body_data = json.loads(response_data["body"])
-                    if "message" in body_data and "content" in body_data["message"]:
-                        content = body_data["message"]["content"]
-                        if isinstance(content, list) and len(content) > 0:
-                            agent_response = content[0].get("text", "No text content")
-                        else:
+                    body_data = response_data["body"]
+                    if isinstance(body_data, (str, bytes)):
+                        body_data = fast_json.loads(body_data)
+                    match body_data:
+                        case {"message": {"content": [{"text": text}, *_]}}:
+                            agent_response = text
+                        case {"message": {"content": [_, *_]}}:
+                            agent_response = "No text content"
+                        case {"message": {"content": _}}:
                             agent_response = "No content available"
-                    else:
-                        agent_response = body_data.get("message", "No message in body")
+                        case _:
+                            agent_response = body_data.get("message", "No message in body")
                 else:
                     agent_response = response_data.get("response", "No response field")
 
                 # Update chat history
-                self.chat_history.append({"user": prompt, "agent": agent_response})
+                self.user_messages.append(prompt)
+                self.agent_messages.append(agent_response)
 
                 return agent_response
             else:
@@ -132,16 +135,13 @@ class HotelBookingChatTester:
                     continue
 
                 # Handle special commands
-                if user_input.lower() == "quit":
-                    print("\n👋 Goodbye! Thanks for testing the hotel booking agent.")
-                    break
-
-                elif user_input.lower() == "history":
-                    self._show_history()
-                    continue
-
-                elif user_input.lower() == "clear":
-                    self._clear_conversation()
+                command = user_input.lower()
+                if command in self._commands:
+                    handler = self._commands[command]
+                    if handler is None:
+                        print("\n👋 Goodbye! Thanks for testing the hotel booking agent.")
+                        break
+                    handler()
                     continue
 
                 # Send message to agent
@@ -161,21 +161,22 @@ class HotelBookingChatTester:
 
     def _show_history(self):
         """Show conversation history"""
-        if not self.chat_history:
+        if not self.user_messages:
             print("📝 No conversation history yet.")
             return
 
         print(f"\n📝 Conversation History (ID: {self.conversation_id})")
         print("-" * 50)
-        for i, turn in enumerate(self.chat_history, 1):
-            print(f"{i}. 👤 You: {turn['user']}")
-            print(f"   🤖 Agent: {turn['agent']}")
+        for i, (user_message, agent_message) in enumerate(zip(self.user_messages, self.agent_messages, strict=True), 1):
+            print(f"{i}. 👤 You: {user_message}")
+            print(f"   🤖 Agent: {agent_message}")
             print()
 
     def _clear_conversation(self):
         """Clear conversation and start fresh"""
-        self.conversation_id = str(uuid.uuid4())
-        self.chat_history = []
+        self.conversation_id = uuid.uuid4().hex
+        self.user_messages = []
+        self.agent_messages = []
         print(f"🔄 Started new conversation (ID: {self.conversation_id})")
 
 
@@ -205,14 +206,9 @@ def run_sample_conversation():
         else:
             print("Error getting response")
 
-        # Small delay for readability
-        import time
-
-        time.sleep(1)
-
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1 and sys.argv[1] == "--sample":
+    if "--sample" in sys.argv[1:]:
         run_sample_conversation()
     else:
         tester = HotelBookingChatTester()
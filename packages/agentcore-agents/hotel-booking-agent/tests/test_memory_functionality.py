@@ -3,10 +3,13 @@
 Test script to demonstrate hotel booking agent memory functionality
 """
 
+import functools
 import json
 import logging
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 
 # Add parent directory to path to import from common and memory modules
@@ -15,13 +18,58 @@ parent_dir = os.path.dirname(current_dir)
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from bedrock_agentcore.memory import MemoryClient  # noqa: E402
-from common.aws_config import AWSConfig  # noqa: E402
-from memory.memory_hooks import MEMORY_NAME  # noqa: E402
+# The AWS SDK and the memory modules are imported inside test_memory_setup and
+# find_memory_setup, so printing the sample payloads does not load them
+
+
+# Memory ID and strategy namespaces persisted between runs of this script
+MEMORY_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "hotel_booking_agent", "memory.json")
+MEMORY_CACHE_TTL_SECONDS = 3600
+
+
+@functools.lru_cache(maxsize=4)
+def find_memory_setup(region, memory_name=None):
+    """Find the memory ID and its namespaces, reusing the result saved by an earlier run for up to an hour"""
+    from memory.memory_hooks import MEMORY_NAME, get_memory_client, get_namespaces, list_memories
+
+    memory_name = memory_name or MEMORY_NAME
+    key = f"{region}:{memory_name}"
+    try:
+        with open(MEMORY_CACHE_PATH) as f:
+            cached = json.load(f)[key]
+        if time.time() - cached["fetched_at"] < MEMORY_CACHE_TTL_SECONDS:
+            return cached["memory_id"], cached["namespaces"]
+    except (OSError, KeyError, TypeError, ValueError):
+        pass
+
+    memory_id = next((m["id"] for m in list_memories(region) if m["id"].startswith(memory_name)), None)
+    if not memory_id:
+        return None, {}
+    namespaces = get_namespaces(get_memory_client(region), memory_id)
+
+    try:
+        os.makedirs(os.path.dirname(MEMORY_CACHE_PATH), exist_ok=True)
+        with open(MEMORY_CACHE_PATH, "w") as f:
+            json.dump({key: {"memory_id": memory_id, "namespaces": namespaces, "fetched_at": time.time()}}, f)
+    except OSError as e:
+        print(f"⚠️ Could not save memory cache: {e}")
+
+    return memory_id, namespaces
+
+
+def clear_memory_setup():
+    """Forget the saved memory setup, e.g. after the memory was deleted or recreated"""
+    find_memory_setup.cache_clear()
+    try:
+        os.remove(MEMORY_CACHE_PATH)
+    except FileNotFoundError:
+        pass
 
 
 def test_memory_setup():
     """Test memory setup and seeding with sample data"""
+    from common.aws_config import AWSConfig
+    from memory.memory_hooks import get_memory_client
 
     # Configuration
     aws_config = AWSConfig(logger=logging.getLogger(__name__))
@@ -33,11 +81,10 @@ def test_memory_setup():
 
     try:
         # Initialize Memory Client
-        client = MemoryClient(region_name=REGION)
+        client = get_memory_client(REGION)
 
-        # Find existing memory
-        memories = client.list_memories()
-        memory_id = next((m["id"] for m in memories if m["id"].startswith(MEMORY_NAME)), None)
+        # Find existing memory and its strategy namespaces
+        memory_id, namespaces = find_memory_setup(REGION)
 
         if not memory_id:
             print("❌ Memory not found. Please run the agent first to create memory.")
@@ -77,17 +124,21 @@ def test_memory_setup():
         print("\n📚 Testing Memory Retrieval:")
         print("-" * 30)
 
-        # Get memory strategies
-        strategies = client.get_memory_strategies(memory_id)
-        namespaces = {i["type"]: i["namespaces"][0] for i in strategies}
-
-        for context_type, namespace_template in namespaces.items():
-            namespace = namespace_template.replace("{actorId}", CUSTOMER_ID)
-
-            memories = client.retrieve_memories(
-                memory_id=memory_id, namespace=namespace, query="hotel preferences and requirements", top_k=3
-            )
-
+        # Namespaces are independent, so retrieve them all at once and print in order
+        with ThreadPoolExecutor(max_workers=max(1, len(namespaces))) as executor:
+            results = {
+                context_type: executor.submit(
+                    client.retrieve_memories,
+                    memory_id=memory_id,
+                    namespace=namespace_template.replace("{actorId}", CUSTOMER_ID),
+                    query="hotel preferences and requirements",
+                    top_k=3,
+                )
+                for context_type, namespace_template in namespaces.items()
+            }
+
+        for context_type, future in results.items():
+            memories = future.result()
             print(f"\n{context_type.upper()} ({len(memories)} items):")
             for i, memory in enumerate(memories, 1):
                 if isinstance(memory, dict):
@@ -103,6 +154,8 @@ def test_memory_setup():
 
     except Exception as e:
         print(f"❌ Error testing memory: {e}")
+        # The saved memory ID may be stale, so look it up again on the next run
+        clear_memory_setup()
         import traceback
 
         traceback.print_exc()
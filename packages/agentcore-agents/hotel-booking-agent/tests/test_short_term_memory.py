@@ -3,22 +3,25 @@
 Test script to demonstrate short-term memory functionality in hotel booking agent
 """
 
+import contextlib
+import functools
+import io
+import logging
 import os
-
-# Add the parent directory to sys.path to find common modules
 import sys
 
 
-parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Add parent directory to path to import from common and memory modules
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-import logging  # noqa: E402
 from common.aws_config import AWSConfig  # noqa: E402
 from memory.short_term_memory import (  # noqa: E402
+    NO_CONVERSATION_HISTORY,
     ShortTermMemoryHooks,
     create_hotel_booking_short_term_memory,
-    format_conversation_history,
     get_conversation_history,
 )
 
@@ -31,6 +34,23 @@ aws_config = AWSConfig(logger)
 AWS_REGION = aws_config.get_region()
 
 
+def _buffered_output(func):
+    """Collect a test's printed output and write it to stdout in one call when the test finishes"""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buffer = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+
+    return wrapper
+
+
+@_buffered_output
 def test_short_term_memory_creation():
     """Test creating short-term memory resource"""
     print("🧠 Testing Short-Term Memory Creation")
@@ -52,6 +72,7 @@ def test_short_term_memory_creation():
         return None, None
 
 
+@_buffered_output
 def test_conversation_storage(memory_client, memory_id):
     """Test storing and retrieving conversation history"""
     print("\n💬 Testing Conversation Storage and Retrieval")
@@ -93,17 +114,18 @@ def test_conversation_storage(memory_client, memory_id):
         print("\n📖 Retrieving conversation history...")
 
         # Retrieve conversation history
-        conversation_turns = get_conversation_history(
+        formatted_history = get_conversation_history(
+            logger=logger,
             memory_client=memory_client,
             memory_id=memory_id,
             actor_id=actor_id,
             session_id=session_id,
-            k=5,  # Get last 3 turns
+            k=5,
         )
 
-        if conversation_turns:
-            print(f"✅ Retrieved {len(conversation_turns)} conversation turns")
-            formatted_history = format_conversation_history(conversation_turns)
+        # An empty list means retrieval failed; the sentinel string means nothing was stored
+        if formatted_history and formatted_history != NO_CONVERSATION_HISTORY:
+            print("✅ Retrieved conversation history")
             print("\nFormatted conversation history:")
             print("-" * 30)
             print(formatted_history)
@@ -120,6 +142,7 @@ def test_conversation_storage(memory_client, memory_id):
         return None, None
 
 
+@_buffered_output
 def test_memory_hooks_simulation(memory_client, memory_id, actor_id, session_id):
     """Test memory hooks functionality (simulation)"""
     print("\n🔗 Testing Memory Hooks Simulation")
@@ -145,13 +168,18 @@ def test_memory_hooks_simulation(memory_client, memory_id, actor_id, session_id)
         print("\n🚀 Simulating agent initialization...")
 
         # Get conversation history (simulating what the hook would do)
-        recent_turns = memory_client.get_last_k_turns(
-            memory_id=memory_id, actor_id=actor_id, session_id=session_id, k=10
+        formatted_history = get_conversation_history(
+            logger=logger,
+            memory_client=memory_client,
+            memory_id=memory_id,
+            actor_id=actor_id,
+            session_id=session_id,
+            k=10,
         )
 
-        if recent_turns:
-            print(f"✅ Retrieved {len(recent_turns)} conversation turns")
-            formatted_history = format_conversation_history(recent_turns)
+        # An empty list means retrieval failed; the sentinel string means nothing was stored
+        if formatted_history and formatted_history != NO_CONVERSATION_HISTORY:
+            print("✅ Retrieved conversation history")
             print("\nFormatted conversation history:")
             print("-" * 30)
             print(formatted_history)
@@ -165,6 +193,7 @@ def test_memory_hooks_simulation(memory_client, memory_id, actor_id, session_id)
         traceback.print_exc()
 
 
+@_buffered_output
 def test_conversation_continuity():
     """Test conversation continuity across sessions"""
     print("\n🔄 Testing Conversation Continuity")
@@ -6,18 +6,99 @@ No fallback to environment variables or .env files.
 """
 
 import boto3
+import functools
+import itertools
 import logging
 import os
+import threading
+import time
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError, NoCredentialsError
+from collections.abc import Mapping
+from types import MappingProxyType
 
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Parameter Store values per region, shared by every Config instance in the process
+_PARAM_CACHE: dict[str, list[dict]] = {}
+_CACHE_TS: dict[str, float] = {}
+_CACHE_LOCK = threading.Lock()
+
+# API key ID -> value per region, listed once per process
+_API_KEY_CACHE: dict[str, dict[str, str]] = {}
+
+# One boto3 session for the process; clients are created from it once per service and region
+_SESSION = boto3.Session()
+_CLIENT_LOCK = threading.Lock()
+
+# Config is loaded during startup, so fail fast on unreachable endpoints and back off on throttling
+_BOTO_CONFIG = BotoConfig(retries={"mode": "adaptive", "max_attempts": 3}, connect_timeout=2, read_timeout=3)
+
+
+def _get_cache_ttl() -> float | None:
+    """Get the configuration cache TTL in seconds from HOTEL_MCP_CONFIG_TTL (unset caches for the process lifetime)."""
+    ttl = os.environ.get("HOTEL_MCP_CONFIG_TTL")
+    return float(ttl) if ttl else None
+
+
+@functools.cache
+def _resolve_region() -> str:
+    """Resolve the AWS region once per process: environment first, then the boto3 session, then us-west-2."""
+    return os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION") or _SESSION.region_name or "us-west-2"
+
+
+def _ensure_api_v1(url: str) -> str:
+    """Add /api/v1 to URL based on Bruno test requirements."""
+    base_url = url.rstrip("/")
+    return base_url if base_url.endswith("/api/v1") else f"{base_url}/api/v1"
+
 
 class Config:
     """Configuration class for Hotel Booking MCP Server using Parameter Store."""
 
+    __slots__ = (
+        "aws_region",
+        "property_resolution_api_url",
+        "property_resolution_api_key",
+        "reservation_services_api_url",
+        "reservation_services_api_key",
+        "toxicity_detection_api_url",
+        "toxicity_detection_api_key",
+        "toxicity_detection_enabled",
+        "_property_resolution_config",
+        "_reservation_services_config",
+        "_toxicity_detection_config",
+        "_missing",
+    )
+
+    # Parameter Store name -> (config attribute, transform). API key parameters hold key IDs
+    # that are resolved through API Gateway, so they have no transform.
+    _PARAM_MAP = {
+        "/hotel_booking_mcp/property_resolution/api_url": ("property_resolution_api_url", _ensure_api_v1),
+        "/hotel_booking_mcp/property_resolution/api_key": ("property_resolution_api_key", None),
+        "/hotel_booking_mcp/reservation_services/api_url": ("reservation_services_api_url", _ensure_api_v1),
+        "/hotel_booking_mcp/reservation_services/api_key": ("reservation_services_api_key", None),
+        # Toxicity detection temporarily disabled
+        # "/hotel_booking_mcp/toxicity_detection/api_url": ("toxicity_detection_api_url", str),
+        # "/hotel_booking_mcp/toxicity_detection/api_key": ("toxicity_detection_api_key", None),
+    }
+
+    # API key parameter values that are used as-is instead of being resolved through API Gateway
+    _SENTINEL_KEYS = frozenset({"no-key-required", "", None})
+
+    # Attributes that must be set for the server to work
+    _REQUIRED_ATTRS = (
+        "property_resolution_api_url",
+        "property_resolution_api_key",
+        "reservation_services_api_url",
+        "reservation_services_api_key",
+        # Toxicity detection temporarily disabled
+        # "toxicity_detection_api_url",
+        # "toxicity_detection_api_key",
+    )
+
     def __init__(self):
         """Initialize configuration from AWS Parameter Store."""
         # Get AWS region from environment or boto3 session
@@ -26,36 +107,32 @@ class Config:
         # Load configuration from Parameter Store
         self._load_from_parameter_store()
 
+        # Build the per-service configs once; the getters return these read-only views
+        self._property_resolution_config = self._build_service_config(
+            self.property_resolution_api_url, self.property_resolution_api_key
+        )
+        self._reservation_services_config = self._build_service_config(
+            self.reservation_services_api_url, self.reservation_services_api_key
+        )
+        self._toxicity_detection_config = self._build_service_config(
+            self.toxicity_detection_api_url, self.toxicity_detection_api_key
+        )
+
+        # Configuration is fixed after loading, so work out what is missing once
+        self._missing = tuple(attr_name for attr_name in self._REQUIRED_ATTRS if not getattr(self, attr_name))
+
         # Validate required configuration
         self._validate_config()
 
     def _get_aws_region(self) -> str:
         """Get AWS region from environment or boto3 session."""
-        # Try environment variable first
-        region = os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION")
-
-        if region:
-            return region
-
-        # Try boto3 session
-        try:
-            session = boto3.Session()
-            region = session.region_name
-            if region:
-                return region
-        except Exception:
-            pass
-
-        # Default fallback
-        return "us-west-2"
+        return _resolve_region()
 
     def _load_from_parameter_store(self) -> None:
         """Load configuration from AWS Parameter Store."""
         try:
-            ssm = boto3.client("ssm", region_name=self.aws_region)
-
             # Get all parameters for the MCP server
-            response = ssm.get_parameters_by_path(Path="/hotel_booking_mcp/", Recursive=True, WithDecryption=True)
+            parameters = self._fetch_parameters(self.aws_region)
 
             # Initialize all config values
             self.property_resolution_api_url = None
@@ -67,58 +144,102 @@ class Config:
             self.toxicity_detection_api_key = None
             self.toxicity_detection_enabled = False
 
-            # Map parameters to config attributes
-            for param in response["Parameters"]:
-                param_name = param["Name"]  # Full parameter name
-                param_value = param["Value"]
-
-                if param_name == "/hotel_booking_mcp/property_resolution/api_url":
-                    # Add /api/v1 to URL based on Bruno test requirements
-                    if not param_value.endswith("/api/v1"):
-                        param_value = param_value.rstrip("/") + "/api/v1"
-                    self.property_resolution_api_url = param_value
-                elif param_name == "/hotel_booking_mcp/property_resolution/api_key":
-                    self.property_resolution_api_key = self._resolve_api_key(param_value)
-                elif param_name == "/hotel_booking_mcp/reservation_services/api_url":
-                    # Add /api/v1 to URL based on Bruno test requirements
-                    if not param_value.endswith("/api/v1"):
-                        param_value = param_value.rstrip("/") + "/api/v1"
-                    self.reservation_services_api_url = param_value
-                elif param_name == "/hotel_booking_mcp/reservation_services/api_key":
-                    self.reservation_services_api_key = self._resolve_api_key(param_value)
-                # elif param_name == '/hotel_booking_mcp/toxicity_detection/api_url':
-                #     self.toxicity_detection_api_url = param_value
-                # elif param_name == '/hotel_booking_mcp/toxicity_detection/api_key':
-                #     self.toxicity_detection_api_key = self._resolve_api_key(param_value)
-
-            logger.info(
-                f"Loaded {len(response['Parameters'])} parameters from Parameter Store in region {self.aws_region}"
-            )
+            # Map parameters to config attributes; API key IDs are collected and resolved afterwards
+            api_key_ids = {}
+            for param in parameters:
+                entry = self._PARAM_MAP.get(param["Name"])
+                if entry is None:
+                    continue
+                attr_name, transform = entry
+                if transform is None:
+                    api_key_ids[attr_name] = param["Value"]
+                else:
+                    setattr(self, attr_name, transform(param["Value"]))
+
+            # The first lookup lists every API key in one call, the rest are served from that listing
+            for attr_name, api_key_id in api_key_ids.items():
+                setattr(self, attr_name, self._resolve_api_key(api_key_id))
+
+            logger.info(f"Loaded {len(parameters)} parameters from Parameter Store in region {self.aws_region}")
 
         except NoCredentialsError as e:
             raise ValueError("AWS credentials not available. Cannot load configuration from Parameter Store.") from e
         except ClientError as e:
             raise ValueError(f"Failed to load configuration from Parameter Store: {e}") from e
+        except ValueError:
+            raise
         except Exception as e:
             raise ValueError(f"Unexpected error loading configuration: {e}") from e
 
+    @staticmethod
+    @functools.cache
+    def _client(service_name: str, region: str):
+        """Get a boto3 client from the shared session, created once per service and region."""
+        # Client creation on a shared session is not thread-safe
+        with _CLIENT_LOCK:
+            return _SESSION.client(service_name, region_name=region, config=_BOTO_CONFIG)
+
+    @classmethod
+    def _fetch_parameters(cls, region: str) -> list[dict]:
+        """Get all MCP server parameters for a region, reusing cached values until the cache TTL expires."""
+        ttl = _get_cache_ttl()
+        with _CACHE_LOCK:
+            if region in _PARAM_CACHE and (ttl is None or time.monotonic() - _CACHE_TS[region] < ttl):
+                return _PARAM_CACHE[region]
+
+            # GetParametersByPath returns at most 10 parameters per call, so read every page
+            ssm = cls._client("ssm", region)
+            pages = ssm.get_paginator("get_parameters_by_path").paginate(
+                Path="/hotel_booking_mcp/", Recursive=True, WithDecryption=True
+            )
+
+            _PARAM_CACHE[region] = list(itertools.chain.from_iterable(page["Parameters"] for page in pages))
+            _CACHE_TS[region] = time.monotonic()
+            return _PARAM_CACHE[region]
+
+    @classmethod
+    def _fetch_all_api_keys(cls, region: str) -> dict[str, str]:
+        """Get every API key value in a region indexed by key ID, listed once per process."""
+        with _CACHE_LOCK:
+            if region not in _API_KEY_CACHE:
+                apigateway = cls._client("apigateway", region)
+                pages = apigateway.get_paginator("get_api_keys").paginate(includeValues=True)
+                try:
+                    _API_KEY_CACHE[region] = {item["id"]: item["value"] for page in pages for item in page["items"]}
+                except ClientError as e:
+                    # Without list access every key falls back to an individual lookup
+                    logger.warning(f"Failed to list API keys, resolving individually: {e}")
+                    _API_KEY_CACHE[region] = {}
+            return _API_KEY_CACHE[region]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _fetch_api_key(region: str, api_key_id: str) -> str:
+        """Get an API key value from API Gateway. Failed lookups raise and are not cached."""
+        apigateway = Config._client("apigateway", region)
+        response = apigateway.get_api_key(apiKey=api_key_id, includeValue=True)
+        return response["value"]
+
     def _resolve_api_key(self, api_key_id: str) -> str:
         """Resolve API key ID to actual API key value."""
-        if api_key_id == "no-key-required":
-            return api_key_id
+        if api_key_id in self._SENTINEL_KEYS:
+            return api_key_id or ""
 
         try:
-            # Use API Gateway client to get the actual API key value
-            apigateway = boto3.client("apigateway", region_name=self.aws_region)
-            response = apigateway.get_api_key(apiKey=api_key_id, includeValue=True)
+            # Use API Gateway to get the actual API key value
+            api_key = self._fetch_all_api_keys(self.aws_region).get(api_key_id) or self._fetch_api_key(
+                self.aws_region, api_key_id
+            )
             logger.info("Successfully resolved API key ID")
-            return response["value"]
+            return api_key
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
             if error_code == "AccessDeniedException":
-                logger.error("Access denied resolving API key ID. Check MCP server IAM permissions for apigateway:GET")
-            else:
-                logger.error(f"Failed to resolve API key ID: {e}")
+                # Fail at startup rather than sending the key ID as the API key on every request
+                raise ValueError(
+                    "Access denied resolving API key ID. Check MCP server IAM permissions for apigateway:GET"
+                ) from e
+            logger.error(f"Failed to resolve API key ID: {e}")
             # Return the ID as fallback - might work if the API expects the ID
             return api_key_id
         except Exception:
@@ -127,78 +248,51 @@ class Config:
 
     def _validate_config(self) -> None:
         """Validate that all required configuration is present."""
-        required_configs = [
-            ("property_resolution_api_url", self.property_resolution_api_url),
-            ("property_resolution_api_key", self.property_resolution_api_key),
-            ("reservation_services_api_url", self.reservation_services_api_url),
-            ("reservation_services_api_key", self.reservation_services_api_key),
-            # Toxicity detection temporarily disabled
-            # ('toxicity_detection_api_url', self.toxicity_detection_api_url),
-            # ('toxicity_detection_api_key', self.toxicity_detection_api_key),
-        ]
-
-        missing_configs = []
-        for config_name, config_value in required_configs:
-            if not config_value:
-                missing_configs.append(config_name)
-
+        missing_configs = self.get_missing_config()
         if missing_configs:
             raise ValueError(
                 f"Missing required Parameter Store configuration: {', '.join(missing_configs)}. "
                 f"Please ensure parameters exist at /hotel_booking_mcp/ path in Parameter Store (region: {self.aws_region})."
             )
 
-    def get_property_resolution_config(self) -> dict:
+    @staticmethod
+    def _build_service_config(base_url: str | None, api_key: str | None) -> Mapping:
+        """Build a read-only API configuration with its request headers."""
+        return MappingProxyType(
+            {
+                "base_url": base_url,
+                "api_key": api_key,
+                "headers": MappingProxyType({"Content-Type": "application/json", "x-api-key": api_key}),
+            }
+        )
+
+    def get_property_resolution_config(self) -> Mapping:
         """Get Property Resolution API configuration."""
-        return {
-            "base_url": self.property_resolution_api_url,
-            "api_key": self.property_resolution_api_key,
-            "headers": {"Content-Type": "application/json", "x-api-key": self.property_resolution_api_key},
-        }
+        return self._property_resolution_config
 
-    def get_reservation_services_config(self) -> dict:
+    def get_reservation_services_config(self) -> Mapping:
         """Get Reservation Services API configuration."""
-        return {
-            "base_url": self.reservation_services_api_url,
-            "api_key": self.reservation_services_api_key,
-            "headers": {"Content-Type": "application/json", "x-api-key": self.reservation_services_api_key},
-        }
+        return self._reservation_services_config
 
-    def get_toxicity_detection_config(self) -> dict:
+    def get_toxicity_detection_config(self) -> Mapping:
         """Get Toxicity Detection API configuration."""
-        return {
-            "base_url": self.toxicity_detection_api_url,
-            "api_key": self.toxicity_detection_api_key,
-            "headers": {"Content-Type": "application/json", "x-api-key": self.toxicity_detection_api_key},
-        }
+        return self._toxicity_detection_config
 
     def is_configured(self) -> bool:
         """Check if all required configuration is present."""
-        try:
-            self._validate_config()
-            return True
-        except ValueError:
-            return False
+        return not self._missing
 
     def get_missing_config(self) -> list[str]:
         """Get list of missing configuration items."""
-        required_configs = [
-            ("property_resolution_api_url", self.property_resolution_api_url),
-            ("property_resolution_api_key", self.property_resolution_api_key),
-            ("reservation_services_api_url", self.reservation_services_api_url),
-            ("reservation_services_api_key", self.reservation_services_api_key),
-            # Toxicity detection temporarily disabled
-            # ('toxicity_detection_api_url', self.toxicity_detection_api_url),
-            # ('toxicity_detection_api_key', self.toxicity_detection_api_key),
-        ]
+        return list(self._missing)
 
-        missing_configs = []
-        for config_name, config_value in required_configs:
-            if not config_value:
-                missing_configs.append(config_name)
 
-        return missing_configs
+@functools.cache
+def get_config() -> Config:
+    """Get the global configuration instance, loading it from Parameter Store on first use."""
+    return Config()
 
 
-# Global configuration instance
-config = Config()
+def get_session() -> boto3.Session:
+    """Get the boto3 session shared by the MCP server."""
+    return _SESSION
@@ -6,20 +6,76 @@ for the hotel booking MCP server. It integrates with real AWS APIs
 for property resolution, reservation services, and toxicity detection.
 """
 
-import boto3
-import json
+import copy
+import functools
 import logging
+import os
 import requests
-from .config import config
+import threading
+import time
+from .config import get_config, get_session
 from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSRequest
-from datetime import datetime
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from requests.adapters import HTTPAdapter
+from types import MappingProxyType
 from typing import Any
+from urllib.parse import quote, urlencode
+from urllib3.util.retry import Retry
 
 
+# orjson serializes booking payloads several times faster when it is installed
+try:
+    import orjson as fast_json
+except ImportError:
+    import json as fast_json
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent API calls issued by the batch helpers
+MAX_BATCH_WORKERS = 10
+
+# Property search results are reused for identical searches for this many seconds (0 disables caching)
+SEARCH_CACHE_TTL_SECONDS = float(os.environ.get("HOTEL_MCP_SEARCH_CACHE_TTL", "300"))
+SEARCH_CACHE_MAX_ENTRIES = 1024
+
+# Session context fields that are the same for every property search
+SEARCH_SESSION_CONTEXT = MappingProxyType(
+    {"country_name": "United States", "region_name": "California", "user_agent": "Hotel Booking MCP Server"}
+)
+
+# HTTP methods used by the Property Resolution and Reservation Services APIs
+SUPPORTED_METHODS = frozenset({"GET", "POST", "PATCH"})
+
+
+def _count_nights(check_in_date: str, check_out_date: str) -> int:
+    """Count the nights between two YYYY-MM-DD dates."""
+    return (date.fromisoformat(check_out_date) - date.fromisoformat(check_in_date)).days
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_booking_id(booking_id: str) -> tuple[str, int]:
+    """
+    Extract the hotel ID from a booking ID of the form {hotelId}CU{digits}.
+
+    Example: "10004CU156038" -> ("10004", 10004)
+
+    Raises:
+        ValueError: If the booking ID does not have a numeric hotel ID before "CU"
+    """
+    separator = booking_id.find("CU")
+    if separator == -1:
+        raise ValueError(
+            f"Invalid booking ID format '{booking_id}'. Expected format: {{hotelId}}CU{{digits}} (e.g., 10004CU156038)"
+        )
+    hotel_id = booking_id[:separator]
+    if not hotel_id.isdigit():
+        raise ValueError(f"Invalid hotel ID in booking ID '{booking_id}'. Hotel ID must be numeric.")
+    return hotel_id, int(hotel_id)
+
 
 class APIError(Exception):
     """Custom exception for API-related errors."""
@@ -27,30 +83,128 @@ class APIError(Exception):
     pass
 
 
+class CachingSigV4Auth(SigV4Auth):
+    """SigV4 signer that reuses the derived signing key for the same secret key and date."""
+
+    def __init__(self, credentials, service_name: str, region_name: str):
+        super().__init__(credentials, service_name, region_name)
+        self._signing_key: tuple[tuple[str, str], bytes] | None = None
+
+    def signature(self, string_to_sign: str, request: AWSRequest) -> str:
+        """Sign the string, deriving the signing key only when the secret key or date changes."""
+        cache_key = (self.credentials.secret_key, request.context["timestamp"][0:8])
+        signing_key = self._signing_key
+        if signing_key is None or signing_key[0] != cache_key:
+            k_date = self._sign(f"AWS4{cache_key[0]}".encode(), cache_key[1])
+            k_region = self._sign(k_date, self._region_name)
+            k_service = self._sign(k_region, self._service_name)
+            signing_key = (cache_key, self._sign(k_service, "aws4_request"))
+            self._signing_key = signing_key
+        return self._sign(signing_key[1], string_to_sign, hex=True)
+
+
 class HotelBookingService:
     """Service class for hotel booking operations with real API integration."""
 
-    def __init__(self):
-        """Initialize the service with API configurations."""
-        self.property_config = config.get_property_resolution_config()
-        self.reservation_config = config.get_reservation_services_config()
+    def __init__(self, property_config: Mapping | None = None, reservation_config: Mapping | None = None):
+        """
+        Initialize the service with API configurations.
+
+        Args:
+            property_config: Property Resolution API configuration (defaults to Parameter Store values)
+            reservation_config: Reservation Services API configuration (defaults to Parameter Store values)
+        """
+        config = get_config()
+        self.property_config = property_config or config.get_property_resolution_config()
+        self.reservation_config = reservation_config or config.get_reservation_services_config()
         # Toxicity detection temporarily disabled
         # self.toxicity_config = config.get_toxicity_detection_config()
 
-        # Initialize AWS session and credentials for SigV4 signing
+        # Endpoint URLs are fixed for the service lifetime, so build them once
+        property_base_url = self.property_config["base_url"]
+        reservation_base_url = self.reservation_config["base_url"]
+        self._urls = MappingProxyType(
+            {
+                "search": f"{property_base_url}/property-resolution",
+                "reservation": f"{reservation_base_url}/reservation",
+                "cancel": f"{reservation_base_url}/reservation/cancel",
+                "availability": f"{reservation_base_url}/reservation/availability",
+                "payment_validate": f"{reservation_base_url}/reservation/payment/validate",
+            }
+        )
+
+        # AWS credentials for SigV4 signing are resolved on the first API call (see _signer), since
+        # walking the credential provider chain can stall on hosts without instance metadata
+        self.region = config.aws_region
+
+        # Pooled HTTP session so API calls reuse connections instead of a new TLS handshake each time.
+        # Retries only apply to idempotent methods, so bookings are never submitted twice.
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=2, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504], raise_on_status=False
+            ),
+        )
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+
+        # Search results keyed by search arguments; entries are (cached_at, result) in insertion order
+        self._search_cache: dict[tuple, tuple[float, dict[str, Any]]] = {}
+        self._search_lock = threading.Lock()
+
+        # Worker threads for the batch helpers; threads are only started when a batch is submitted
+        self._executor = ThreadPoolExecutor(max_workers=MAX_BATCH_WORKERS, thread_name_prefix="hotel-booking-api")
+
+    def _get_cached_search(self, cache_key: tuple) -> dict[str, Any] | None:
+        """Get a copy of a cached search result if it has not expired."""
+        with self._search_lock:
+            entry = self._search_cache.get(cache_key)
+            if entry is None:
+                return None
+            cached_at, result = entry
+            if time.monotonic() - cached_at >= SEARCH_CACHE_TTL_SECONDS:
+                del self._search_cache[cache_key]
+                return None
+        return copy.deepcopy(result)
+
+    def _cache_search(self, cache_key: tuple, result: dict[str, Any]) -> None:
+        """Cache a copy of a search result, evicting the oldest entry when the cache is full."""
+        if SEARCH_CACHE_TTL_SECONDS <= 0:
+            return
+        result = copy.deepcopy(result)
+        with self._search_lock:
+            self._search_cache.pop(cache_key, None)
+            if len(self._search_cache) >= SEARCH_CACHE_MAX_ENTRIES:
+                del self._search_cache[next(iter(self._search_cache))]
+            self._search_cache[cache_key] = (time.monotonic(), result)
+
+    @functools.cached_property
+    def _signer(self) -> CachingSigV4Auth | None:
+        """Initialize AWS session and credentials for SigV4 signing on first use."""
         try:
-            self.session = boto3.Session()
+            # Reuse the session that loaded the configuration rather than building a second one
+            self.session = get_session()
             self.credentials = self.session.get_credentials()
-            self.region = self.session.region_name or config.aws_region
+            self.region = self.session.region_name or self.region
             logger.info(f"Initialized AWS session with region: {self.region}")
         except Exception as e:
             logger.warning(f"Could not initialize AWS session: {e}. Will fall back to API key only.")
             self.session = None
             self.credentials = None
-            self.region = config.aws_region
+            return None
+
+        # One signer for the service lifetime so the signing key is derived once per day, not per request
+        return CachingSigV4Auth(self.credentials, "execute-api", self.region) if self.credentials else None
+
+    def close(self) -> None:
+        """Stop the batch worker threads and close pooled HTTP connections."""
+        self._executor.shutdown(wait=False)
+        self._http.close()
 
     def _make_api_request(
-        self, method: str, url: str, headers: dict, data: dict | None = None, timeout: int = 30
+        self, method: str, url: str, headers: Mapping, data: dict | None = None, timeout: int = 30
     ) -> dict:
         """
         Make an API request with AWS SigV4 signing and error handling.
@@ -69,35 +223,43 @@ class HotelBookingService:
             APIError: If the request fails
         """
         try:
-            logger.info(f"Making {method} request")
+            logger.info("Making %s request", method)
 
             # Prepare the request body
             body = None
             if data:
-                body = json.dumps(data)
-                headers["Content-Type"] = "application/json"
+                body = fast_json.dumps(data)
+                # Configured headers are shared read-only mappings, so copy rather than modify them
+                if headers.get("Content-Type") != "application/json":
+                    headers = {**headers, "Content-Type": "application/json"}
 
             # If we have AWS credentials, sign the request with SigV4
-            if self.credentials:
+            if self._signer:
                 try:
-                    logger.info(f"Attempting SigV4 signing with credentials for region: {self.region}")
-
                     # Create AWS request for signing
                     aws_request = AWSRequest(method=method.upper(), url=url, data=body, headers=headers)
 
                     # Sign with SigV4 using the IAM role credentials
-                    SigV4Auth(self.credentials, "execute-api", self.region).add_auth(aws_request)
+                    self._signer.add_auth(aws_request)
 
-                    # Use the signed headers
+                    # Use the signed headers. AWSRequest keeps them in an HTTPHeaders message, which requests
+                    # cannot merge as a mapping (iterating it yields only names), so one copy is needed here.
+                    # Unsigned requests pass the configured headers through without copying.
                     signed_headers = dict(aws_request.headers)
-                    logger.info("✅ Request signed with AWS SigV4")
 
-                    # Log if Authorization header was added (without showing value)
-                    if "Authorization" in signed_headers:
-                        logger.info("Authorization header present")
+                    # Per-request signing details are only worth formatting when debugging
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("✅ Request signed with AWS SigV4 for region: %s", self.region)
+                        # Log if Authorization header was added (without showing value)
+                        if "Authorization" in signed_headers:
+                            logger.debug("Authorization header present")
                 except Exception as e:
-                    logger.warning(f"Failed to sign request with SigV4: {e}. Using API key only.")
-                    logger.exception("SigV4 signing error details:")
+                    # Include the traceback only when debugging
+                    logger.warning(
+                        "Failed to sign request with SigV4: %s. Using API key only.",
+                        e,
+                        exc_info=logger.isEnabledFor(logging.DEBUG),
+                    )
                     signed_headers = headers
             else:
                 # No AWS credentials, use headers as-is (API key only)
@@ -105,17 +267,12 @@ class HotelBookingService:
                 signed_headers = headers
 
             # Make the actual HTTP request
-            if method.upper() == "GET":
-                response = requests.get(url, headers=signed_headers, timeout=timeout)
-            elif method.upper() == "POST":
-                response = requests.post(url, headers=signed_headers, data=body, timeout=timeout)
-            elif method.upper() == "PATCH":
-                response = requests.patch(url, headers=signed_headers, data=body, timeout=timeout)
-            else:
+            if method.upper() not in SUPPORTED_METHODS:
                 raise APIError(f"Unsupported HTTP method: {method}")
+            response = self._http.request(method.upper(), url, headers=signed_headers, data=body, timeout=timeout)
 
             # Log response status
-            logger.info(f"API response status: {response.status_code}")
+            logger.info("API response status: %s", response.status_code)
 
             # Check for HTTP errors
             if response.status_code >= 400:
@@ -127,8 +284,8 @@ class HotelBookingService:
                     error_msg += f": {response.text}"
                 raise APIError(error_msg)
 
-            # Parse JSON response
-            return response.json()
+            # Parse JSON response straight from the raw bytes
+            return fast_json.loads(response.content)
 
         except requests.exceptions.Timeout as e:
             raise APIError(f"API request timed out after {timeout} seconds") from e
@@ -155,20 +312,25 @@ class HotelBookingService:
         Returns:
             Dictionary with search results
         """
+        # Availability changes slowly, so identical searches within the TTL reuse the earlier result
+        cache_key = (location, check_in_date, check_out_date, guests, min_rating)
+        cached = self._get_cached_search(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # Prepare search request using actual Property Resolution API format
-            search_url = f"{self.property_config['base_url']}/property-resolution"
+            search_url = self._urls["search"]
+            now = datetime.now()
             search_data = {
                 "unique_client_id": "AWS_PACE_Agent",
                 "anon_guest_id": "guest_12345",
                 "input": {"query": f"{location} check-in {check_in_date} check-out {check_out_date} guests {guests}"},
                 "session_context": {
-                    "session_id": f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                    "local_ts": datetime.now().isoformat() + "Z",
-                    "country_name": "United States",
-                    "region_name": "California",
+                    **SEARCH_SESSION_CONTEXT,
+                    "session_id": f"session_{now:%Y%m%d_%H%M%S}",
+                    "local_ts": f"{now.isoformat()}Z",
                     "city_name": location,
-                    "user_agent": "Hotel Booking MCP Server",
                 },
             }
 
@@ -181,31 +343,31 @@ class HotelBookingService:
             properties = response.get("result", [])
 
             # Calculate nights for pricing
-            check_in = datetime.strptime(check_in_date, "%Y-%m-%d")
-            check_out = datetime.strptime(check_out_date, "%Y-%m-%d")
-            nights = (check_out - check_in).days
+            nights = _count_nights(check_in_date, check_out_date)
+
+            # Basic room type info is the same for every hotel (can be enhanced later), so build it once
+            room_types = {
+                "standard": {
+                    "price": 350.0,  # Default price
+                    "total_price": 350.0 * nights,
+                    "price_per_night": 350.0,
+                }
+            }
 
             # Transform properties to expected format and add calculated pricing
-            hotels = []
-            for prop in properties:
-                hotel = {
+            hotels = [
+                {
                     "hotel_id": prop.get("hotel_id"),
                     "spirit_cd": prop.get("spirit_cd"),
                     "rank": prop.get("rank"),
                     "metadata": prop.get("metadata", {}),
                     "nights": nights,
-                    # Add basic room type info (can be enhanced later)
-                    "room_types": {
-                        "standard": {
-                            "price": 350.0,  # Default price
-                            "total_price": 350.0 * nights,
-                            "price_per_night": 350.0,
-                        }
-                    },
+                    "room_types": room_types,
                 }
-                hotels.append(hotel)
+                for prop in properties
+            ]
 
-            return {
+            result = {
                 "status": "success",
                 "search_criteria": {
                     "location": location,
@@ -217,6 +379,8 @@ class HotelBookingService:
                 "hotels_found": len(hotels),
                 "hotels": hotels,
             }
+            self._cache_search(cache_key, result)
+            return result
 
         except APIError as e:
             logger.error(f"Property Resolution API error: {str(e)}")
@@ -225,6 +389,35 @@ class HotelBookingService:
             logger.error(f"Unexpected error in hotel search: {str(e)}")
             return {"status": "error", "message": f"Hotel search failed: {str(e)}"}
 
+    def search_properties_batch(
+        self,
+        locations: Iterable[str],
+        check_in_date: str,
+        check_out_date: str,
+        guests: int = 2,
+        min_rating: float = 0.0,
+    ) -> list[dict[str, Any]]:
+        """
+        Search several locations concurrently using Property Resolution API.
+
+        Args:
+            locations: Locations to search for properties
+            check_in_date: Check-in date (YYYY-MM-DD)
+            check_out_date: Check-out date (YYYY-MM-DD)
+            guests: Number of guests
+            min_rating: Minimum property rating
+
+        Returns:
+            List of search results in the same order as locations
+        """
+        # Requests share the pooled HTTP session, so the searches overlap instead of running back to back
+        return list(
+            self._executor.map(
+                lambda location: self.search_properties(location, check_in_date, check_out_date, guests, min_rating),
+                locations,
+            )
+        )
+
     def create_reservation(
         self,
         hotel_id: str,
@@ -254,7 +447,7 @@ class HotelBookingService:
         """
         try:
             # Prepare booking request using actual Reservation Services API format
-            booking_url = f"{self.reservation_config['base_url']}/reservation"
+            booking_url = self._urls["reservation"]
 
             # Split guest name into first and last name
             name_parts = guest_name.split(" ", 1)
@@ -271,7 +464,7 @@ class HotelBookingService:
                 }
 
             booking_data = {
-                "BookingInfo": {"BookedBy": guest_name, "BookingDate": datetime.now().strftime("%Y-%m-%d")},
+                "BookingInfo": {"BookedBy": guest_name, "BookingDate": date.today().isoformat()},
                 "Hotel": {"Id": hotel_id_int, "Code": f"H{hotel_id_int}", "Name": f"Hotel {hotel_id_int}"},
                 "RoomStay": {
                     "CheckInDate": check_in_date,
@@ -333,21 +526,12 @@ class HotelBookingService:
         """
         try:
             # Extract hotel ID from booking ID format: {hotelId}CU{digits}
-            # Example: "10004CU156038" -> hotel_id = "10004"
-            if "CU" not in booking_id:
-                return {
-                    "status": "error",
-                    "message": f"Invalid booking ID format '{booking_id}'. Expected format: {{hotelId}}CU{{digits}} (e.g., 10004CU156038)",
-                }
-
-            hotel_id = booking_id.split("CU")[0]
-            if not hotel_id.isdigit():
-                return {
-                    "status": "error",
-                    "message": f"Invalid hotel ID in booking ID '{booking_id}'. Hotel ID must be numeric.",
-                }
+            try:
+                hotel_id, _ = _parse_booking_id(booking_id)
+            except ValueError as ve:
+                return {"status": "error", "message": str(ve)}
 
-            booking_url = f"{self.reservation_config['base_url']}/reservation/hotel/{hotel_id}/{booking_id}"
+            booking_url = f"{self._urls['reservation']}/hotel/{hotel_id}/{booking_id}"
 
             response = self._make_api_request(method="GET", url=booking_url, headers=self.reservation_config["headers"])
 
@@ -378,24 +562,13 @@ class HotelBookingService:
         """
         try:
             # Extract hotel ID from booking ID format: {hotelId}CU{digits}
-            # Example: "10004CU156038" -> hotel_id = 10004
-            if "CU" not in booking_id:
-                return {
-                    "status": "error",
-                    "message": f"Invalid booking ID format '{booking_id}'. Expected format: {{hotelId}}CU{{digits}} (e.g., 10004CU156038)",
-                }
-
-            hotel_id_str = booking_id.split("CU")[0]
-            if not hotel_id_str.isdigit():
-                return {
-                    "status": "error",
-                    "message": f"Invalid hotel ID in booking ID '{booking_id}'. Hotel ID must be numeric.",
-                }
-
-            hotel_id = int(hotel_id_str)
+            try:
+                _, hotel_id = _parse_booking_id(booking_id)
+            except ValueError as ve:
+                return {"status": "error", "message": str(ve)}
 
             # Use the correct Mock API endpoint: /reservation/cancel
-            cancel_url = f"{self.reservation_config['base_url']}/reservation/cancel"
+            cancel_url = self._urls["cancel"]
             cancel_data = {
                 "Hotel": {"Id": hotel_id},  # Use extracted hotel ID
                 "CrsConfirmationNumber": booking_id,
@@ -432,26 +605,25 @@ class HotelBookingService:
         """
         try:
             # Get booking history from Reservation Services API using actual endpoint
-            history_url = f"{self.reservation_config['base_url']}/reservation"
-            params = {"pageSize": "0"}  # Get all reservations
+            history_url = self._urls["reservation"]
+            # The API filters by guest email so only that guest's reservations cross the wire
+            params = {"email": guest_email, "pageSize": "0"}  # Get all matching reservations
 
-            # Add query parameters to URL
-            history_url += "?" + "&".join([f"{k}={v}" for k, v in params.items()])
+            # Add query parameters to URL, escaping characters such as "+" in email addresses
+            history_url = f"{history_url}?{urlencode(params, quote_via=quote)}"
 
             response = self._make_api_request(method="GET", url=history_url, headers=self.reservation_config["headers"])
 
-            # Filter bookings by guest email
-            all_bookings = response.get("reservations", [])
-            bookings = []
-            for booking in all_bookings:
-                # Check if any guest has the matching email
-                guests = booking.get("Guests", [])
-                for guest in guests:
-                    email_addresses = guest.get("EmailAddress", [])
-                    for email in email_addresses:
-                        if email.get("Value") == guest_email:
-                            bookings.append(booking)
-                            break
+            # Filter bookings by guest email as well, in case the endpoint ignores the email parameter
+            bookings = [
+                booking
+                for booking in response.get("reservations", [])
+                if any(
+                    email.get("Value") == guest_email
+                    for guest in booking.get("Guests", [])
+                    for email in guest.get("EmailAddress", [])
+                )
+            ]
 
             return {
                 "status": "success",
@@ -484,7 +656,7 @@ class HotelBookingService:
         """
         try:
             # Use the correct Mock API endpoint: GET /reservation/availability with query parameters
-            availability_url = f"{self.reservation_config['base_url']}/reservation/availability"
+            availability_url = self._urls["availability"]
 
             # Build query parameters
             params = {"hotel_id": hotel_id, "check_in_date": check_in_date, "check_out_date": check_out_date}
@@ -492,18 +664,15 @@ class HotelBookingService:
             if room_type:
                 params["room_type"] = room_type
 
-            # Add query parameters to URL
-            query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-            availability_url += f"?{query_string}"
+            # Add query parameters to URL, escaping characters such as spaces in room types
+            availability_url = f"{availability_url}?{urlencode(params, quote_via=quote)}"
 
             response = self._make_api_request(
                 method="GET", url=availability_url, headers=self.reservation_config["headers"]
             )
 
             # Calculate nights
-            check_in = datetime.strptime(check_in_date, "%Y-%m-%d")
-            check_out = datetime.strptime(check_out_date, "%Y-%m-%d")
-            nights = (check_out - check_in).days
+            nights = _count_nights(check_in_date, check_out_date)
 
             return {
                 "status": "success",
@@ -521,6 +690,29 @@ class HotelBookingService:
             logger.error(f"Unexpected error checking availability: {str(e)}")
             return {"status": "error", "message": f"Failed to check availability: {str(e)}"}
 
+    def check_availability_bulk(
+        self, hotel_ids: Iterable[str], check_in_date: str, check_out_date: str, room_type: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Check room availability at several hotels concurrently using Reservation Services API.
+
+        Args:
+            hotel_ids: Hotel identifiers
+            check_in_date: Check-in date (YYYY-MM-DD)
+            check_out_date: Check-out date (YYYY-MM-DD)
+            room_type: Specific room type to check (optional)
+
+        Returns:
+            List of availability results in the same order as hotel_ids
+        """
+        # Requests share the pooled HTTP session, so the checks overlap instead of running back to back
+        return list(
+            self._executor.map(
+                lambda hotel_id: self.check_room_availability(hotel_id, check_in_date, check_out_date, room_type),
+                hotel_ids,
+            )
+        )
+
     def validate_payment_details(self, payment_info: dict[str, Any]) -> dict[str, Any]:
         """
         Validate payment details using Reservation Services API.
@@ -533,7 +725,7 @@ class HotelBookingService:
         """
         try:
             # Use the correct Mock API endpoint: /reservation/payment/validate
-            validation_url = f"{self.reservation_config['base_url']}/reservation/payment/validate"
+            validation_url = self._urls["payment_validate"]
 
             response = self._make_api_request(
                 method="POST", url=validation_url, headers=self.reservation_config["headers"], data=payment_info
@@ -581,44 +773,43 @@ class HotelBookingService:
             Dictionary with modification confirmation
         """
         try:
+            # Nothing to change, so skip the PATCH round trip
+            if not any((check_in_date, check_out_date, room_type, guests, special_requests, guest_name, guest_email)):
+                return {"status": "error", "message": "No fields to modify"}
+
             # Prepare modification request using actual Reservation Services API format
-            modify_url = f"{self.reservation_config['base_url']}/reservation"
+            modify_url = self._urls["reservation"]
 
             # Build update data - only include fields that are being changed
-            update_data = {"Reservations": [{"CrsConfirmationNumber": booking_id}]}
-
-            reservation = update_data["Reservations"][0]
-
-            # Add fields that are being modified
-            if check_in_date or check_out_date or room_type or guests:
-                reservation["RoomStay"] = {}
-
-                if check_in_date:
-                    reservation["RoomStay"]["CheckInDate"] = check_in_date
-                if check_out_date:
-                    reservation["RoomStay"]["CheckOutDate"] = check_out_date
-                if guests:
-                    reservation["RoomStay"]["GuestCount"] = [{"NumGuests": guests}]
-                if room_type:
-                    reservation["RoomStay"]["Products"] = [{"Product": {"RoomCode": room_type, "RoomName": room_type}}]
-
-            if guest_name or guest_email or special_requests:
-                reservation["Guests"] = [{}]
-                guest = reservation["Guests"][0]
-
-                if guest_name:
-                    # Split guest name into first and last name
-                    name_parts = guest_name.split(" ", 1)
-                    given_name = name_parts[0] if name_parts else guest_name
-                    surname = name_parts[1] if len(name_parts) > 1 else ""
-
-                    guest["PersonName"] = {"GivenName": given_name, "Surname": surname}
+            room_stay = {
+                key: value
+                for key, value in (
+                    ("CheckInDate", check_in_date),
+                    ("CheckOutDate", check_out_date),
+                    ("GuestCount", guests and [{"NumGuests": guests}]),
+                    ("Products", room_type and [{"Product": {"RoomCode": room_type, "RoomName": room_type}}]),
+                )
+                if value
+            }
 
-                if guest_email:
-                    guest["EmailAddress"] = [{"Type": "Primary", "Value": guest_email}]
+            # Split guest name into first and last name
+            given_name, _, surname = (guest_name or "").partition(" ")
+            guest = {
+                key: value
+                for key, value in (
+                    ("PersonName", guest_name and {"GivenName": given_name, "Surname": surname}),
+                    ("EmailAddress", guest_email and [{"Type": "Primary", "Value": guest_email}]),
+                    ("Comments", special_requests),
+                )
+                if value
+            }
 
-                if special_requests:
-                    guest["Comments"] = special_requests
+            reservation = {"CrsConfirmationNumber": booking_id}
+            if room_stay:
+                reservation["RoomStay"] = room_stay
+            if guest:
+                reservation["Guests"] = [guest]
+            update_data = {"Reservations": [reservation]}
 
             # Make API request
             response = self._make_api_request(
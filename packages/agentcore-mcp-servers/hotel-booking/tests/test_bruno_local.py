@@ -92,13 +92,12 @@ class BrunoHotelBookingService:
         try:
             from common.hotel_booking_support import HotelBookingService
 
-            # Create the actual service instance
-            self.actual_service = HotelBookingService()
-
-            # Replace its configuration with Bruno values
+            # Create the actual service instance with Bruno configuration values
             bruno_config = BrunoConfig()
-            self.actual_service.property_config = bruno_config.get_property_resolution_config()
-            self.actual_service.reservation_config = bruno_config.get_reservation_services_config()
+            self.actual_service = HotelBookingService(
+                property_config=bruno_config.get_property_resolution_config(),
+                reservation_config=bruno_config.get_reservation_services_config(),
+            )
 
             logger.info("✅ MCP server service initialized with Bruno configuration")
 
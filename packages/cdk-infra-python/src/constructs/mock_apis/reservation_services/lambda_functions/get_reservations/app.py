@@ -7,6 +7,15 @@ from common.response_utils import build_error_response, build_response
 dynamo_client = DynamoDBClient()
 
 
+def has_guest_email(reservation, email):
+    """Check whether any guest on the reservation has the given email address."""
+    return any(
+        address.get("Value") == email
+        for guest in reservation.get("Guests", [])
+        for address in guest.get("EmailAddress", [])
+    )
+
+
 def handler(event, context):  # noqa: ARG001
     """
     Handler for GET /reservation endpoint.
@@ -16,6 +25,7 @@ def handler(event, context):  # noqa: ARG001
     - crsConfirmationNumber: Array of confirmation numbers to match
     - arrival: Range of arrival dates (format: 'YYYY-MM-DD;YYYY-MM-DD')
     - departure: Range of departure dates (format: 'YYYY-MM-DD;YYYY-MM-DD')
+    - email: Guest email address to match
     - pageStart: Starting record for pagination
     - pageSize: Number of records per page
 
@@ -78,6 +88,11 @@ def handler(event, context):  # noqa: ARG001
                 departure_date_range=departure_date_range,
             )
 
+        # Only return reservations for the requested guest
+        guest_email = query_params.get("email")
+        if guest_email:
+            reservations = [reservation for reservation in reservations if has_guest_email(reservation, guest_email)]
+
         # Apply pagination
         total_count = len(reservations)
 
@@ -34,6 +34,7 @@ class HotelBookingAgentStack(Stack):
         cognito_config = self.node.try_get_context("cognito") or {}
 
         self.tool_name = agentcore_context.get("tool-name", "hotel_booking_agent")
+        self.short_term_memory_id_parameter_name = f"/{self.tool_name}/runtime/short_term_memory_id"
         test_username = cognito_config.get("testUsername", "testuser")
         test_password = cognito_config.get("testPassword", "MyPassword123!")
 
@@ -126,6 +127,13 @@ class HotelBookingAgentStack(Stack):
                     ],
                     resources=["*"],
                 ),
+                iam.PolicyStatement(
+                    sid="ParameterStoreMemoryId",
+                    actions=["ssm:PutParameter"],
+                    resources=[
+                        f"arn:aws:ssm:{self.region}:{self.account}:parameter{self.short_term_memory_id_parameter_name}"
+                    ],
+                ),
                 iam.PolicyStatement(
                     sid="SecretsManagerReadOnly",
                     actions=["secretsmanager:GetSecretValue", "secretsmanager:DescribeSecret"],
@@ -298,7 +306,11 @@ def handler(event, context):
                 f"https://cognito-idp.{self.region}.amazonaws.com/{self.user_pool.user_pool_id}/.well-known/openid-configuration",
                 [self.user_pool_client.user_pool_client_id],
             ),
-            environment_variables={"AWS_REGION": self.region, "AWS_DEFAULT_REGION": self.region},
+            environment_variables={
+                "AWS_REGION": self.region,
+                "AWS_DEFAULT_REGION": self.region,
+                "SHORT_TERM_MEMORY_ID_PARAMETER": self.short_term_memory_id_parameter_name,
+            },
         )
 
         runtime.node.add_dependency(self.agentcore_policy)
@@ -348,6 +360,14 @@ def handler(event, context):
             parameter_name=f"/{self.tool_name}/runtime/agent_id",
             string_value=self.runtime.agent_runtime_id,
         )
+        # Owned by the stack so it is removed on delete; the runtime overwrites the placeholder
+        # with the short-term memory ID once it has been resolved
+        ssm.StringParameter(
+            self,
+            "ShortTermMemoryIdParameter",
+            parameter_name=self.short_term_memory_id_parameter_name,
+            string_value="unset",
+        )
 
     def _create_outputs(self) -> None:
         """Create CloudFormation outputs"""
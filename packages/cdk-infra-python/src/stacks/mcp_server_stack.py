@@ -155,7 +155,10 @@ class HotelBookingMCPStack(Stack):
                 iam.PolicyStatement(
                     sid="ApiGatewayReadOnly",
                     actions=["apigateway:GET"],
-                    resources=[f"arn:aws:apigateway:{self.region}::/apikeys/*"],
+                    resources=[
+                        f"arn:aws:apigateway:{self.region}::/apikeys",
+                        f"arn:aws:apigateway:{self.region}::/apikeys/*",
+                    ],
                 ),
             ],
         )